@@ -1,324 +1,248 @@
 """
 Source 7 Cleanup Analysis with Revised Understanding
 Creates separate CSVs for review before any data modification
+
+Classification runs as one vectorized pass over the whole source frame:
+every rule below is expressed as a boolean mask and resolved in priority
+order with np.select, so no per-row Python loop is involved. Rows are
+classified independently, so large inputs can also be split into chunks
+and classified on several worker processes (see n_jobs).
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
-import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+# Patterns that mark structured sector comparison tables (need at least 2)
+SECTOR_INDICATORS = [
+    r'ict.*manufacturing|manufacturing.*ict',
+    r'50-249|250\+',
+    r'\b(?:deu|fra|ita|jpn|can)\b.*\d+\s*\(',
+    r'\d+\s*\(\d+\.\d+%\)'
+]
+
+COUNTRY_MAP = {
+    'deu': 'Germany',
+    'fra': 'France',
+    'ita': 'Italy',
+    'jpn': 'Japan',
+    'can': 'Canada'
+}
+
+EMPLOYMENT_PATTERN = r'employment|jobs|occupation|worker|labor'
+PRODUCTIVITY_PATTERN = r'productivity|efficiency|output|performance'
+
+KEEP_COLUMNS = ['original_id', 'value', 'unit', 'year', 'metric_type',
+                'context_preview', 'reason', 'confidence']
+MODIFY_COLUMNS = ['original_id', 'value', 'unit', 'year', 'current_metric_type',
+                  'new_metric_type', 'context_preview', 'sector', 'country',
+                  'company_size', 'reason', 'confidence']
+
+
+def categorize_records(df):
+    """Categorize all records into keep/remove/modify
+
+    Returns a frame with one row per input record, in input order,
+    holding the proposed action and the fields for every output CSV.
+    """
+    raw_context = df['context'].fillna('').astype(str)
+    context = raw_context.str.lower()
+    value = df['value']
+    unit = df['unit']
+    metric_type = df['metric_type']
+
+    is_zero_pct = (value == 0.0) & (unit == 'percentage')
+    context_len = context.str.len()
+
+    # Energy_unit errors come first (definite removal)
+    is_energy = (unit == 'energy_unit').to_numpy()
+
+    # Structured sector data is enriched, unless it is a 0.0% fragment
+    is_sector = sector_comparison_mask(context).to_numpy() & ~is_energy
+    is_sector_dup = is_sector & (is_zero_pct & (raw_context.str.len() < 100)).to_numpy()
+
+    # Everything else goes through the non-sector rules, in priority order
+    other = ~(is_energy | is_sector)
+    is_employment = context.str.contains(EMPLOYMENT_PATTERN, regex=True).to_numpy()
+    is_productivity = context.str.contains(PRODUCTIVITY_PATTERN, regex=True).to_numpy() & ~is_employment
+    is_fragment = (is_zero_pct & (context_len < 50)).to_numpy() & ~is_employment & ~is_productivity
+    is_general = (metric_type == 'general_rate').to_numpy() & ~is_employment & ~is_productivity & ~is_fragment
+    is_growth = context.str.contains('growth|increase', regex=True).to_numpy()
+    is_adopt = context.str.contains('adopt|usage', regex=True).to_numpy()
+
+    # (condition, action, new_metric_type, reason, confidence)
+    rules = [
+        (is_energy, 'remove', '',
+         'Energy unit is actually a citation year from references', 0.95),
+        (is_sector_dup, 'remove', '',
+         'Duplicate sector comparison data (same country/sector/size/value)', 0.85),
+        (is_sector, 'modify', 'adoption_metric',
+         'Sector comparison data - enrich with metadata', 0.90),
+        (other & is_employment & (metric_type != 'employment_metric').to_numpy(), 'modify', 'employment_metric',
+         'Context indicates employment-related metric', 0.85),
+        (other & is_employment, 'keep', '',
+         'Properly classified employment metric', 0.90),
+        (other & is_productivity & (metric_type != 'productivity_metric').to_numpy(), 'modify', 'productivity_metric',
+         'Context indicates productivity-related metric', 0.85),
+        (other & is_productivity, 'keep', '',
+         'Properly classified productivity metric', 0.90),
+        (other & is_fragment, 'remove', '',
+         'Fragment with 0.0% - likely parsing error', 0.80),
+        (other & is_general & is_growth, 'modify', 'growth_metric',
+         'Context indicates growth metric', 0.75),
+        (other & is_general & is_adopt, 'modify', 'adoption_metric',
+         'Context indicates adoption metric', 0.75),
+        (other & is_general, 'keep', '',
+         'General rate - needs manual review for classification', 0.50),
+    ]
+    conditions = [rule[0] for rule in rules]
+
+    result = pd.DataFrame({
+        'original_id': df.index,
+        'value': value.to_numpy(),
+        'unit': unit.to_numpy(),
+        'year': df['year'].to_numpy(),
+        'metric_type': metric_type.to_numpy(),
+        'context_preview': np.where(context_len > 100, context.str.slice(0, 100) + '...', context),
+        'action': np.select(conditions, [rule[1] for rule in rules], default='keep'),
+        'new_metric_type': np.select(conditions, [rule[2] for rule in rules], default=''),
+        'reason': np.select(conditions, [rule[3] for rule in rules], default='No issues detected'),
+        'confidence': np.select(conditions, [rule[4] for rule in rules], default=0.70),
+    })
+
+    # Sector metadata is only reported for enriched sector records
+    sector_info = extract_sector_info(context, raw_context)
+    enrich = is_sector & ~is_sector_dup
+    for column in ('sector', 'country', 'company_size'):
+        result[column] = np.where(enrich, sector_info[column].to_numpy(), '')
+
+    return result
+
+
+def sector_comparison_mask(context):
+    """Flag records that contain sector comparison data"""
+    matches = sum(
+        context.str.contains(pattern, case=False, regex=True).astype(int)
+        for pattern in SECTOR_INDICATORS
+    )
+    return matches >= 2  # Need at least 2 indicators
+
+
+def extract_sector_info(context, raw_context):
+    """Extract structured country/sector/size columns from sector data"""
+    head = context.str.slice(0, 20)
+
+    # First listed country code found in the context wins
+    country = np.select(
+        [context.str.contains(code, regex=False) for code in COUNTRY_MAP],
+        list(COUNTRY_MAP.values()),
+        default=''
+    )
+
+    has_ict = context.str.contains('ict', regex=False)
+    has_manufacturing = context.str.contains('manufacturing', regex=False)
+    sector = np.select(
+        [has_ict & ~head.str.contains('manufacturing', regex=False),
+         has_manufacturing & ~head.str.contains('ict', regex=False)],
+        ['ICT', 'Manufacturing'],
+        default=''
+    )
+
+    size = np.select(
+        [raw_context.str.contains('50-249', regex=False),
+         raw_context.str.contains(r'250\\?\+', regex=True)],
+        ['50-249', '250+'],
+        default=''
+    )
+
+    return pd.DataFrame({'country': country, 'sector': sector, 'company_size': size},
+                        index=context.index)
+
+
+def categorize_records_parallel(df, n_jobs):
+    """Classify df in n_jobs contiguous chunks on separate worker processes"""
+    chunks = [df.iloc[bounds[0]:bounds[-1] + 1]
+              for bounds in np.array_split(np.arange(len(df)), n_jobs) if len(bounds)]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        results = list(executor.map(categorize_records, chunks))
+    return pd.concat(results, ignore_index=True)
+
+
 class Source7CleanupAnalyzer:
-    def __init__(self):
-        self.df = pd.read_csv('data/exports/ai_metrics_20250719.csv')
-        self.source_7_df = self.df[self.df['source_id'] == 7].copy()
-        self.records_to_keep = []
-        self.records_to_remove = []
-        self.records_to_modify = []
-        
+    def __init__(self, n_jobs=1):
+        """
+        Args:
+            n_jobs: Worker processes used for classification (1 = in-process)
+        """
+        self.n_jobs = max(1, n_jobs)
+        # Only Source 7 is analyzed, so the full export is not kept resident
+        full_df = pd.read_csv('data/exports/ai_metrics_20250719.csv')
+        self.source_7_df = full_df[full_df['source_id'] == 7].copy()
+        del full_df
+        self.records_to_keep = pd.DataFrame(columns=KEEP_COLUMNS)
+        self.records_to_remove = pd.DataFrame(columns=KEEP_COLUMNS)
+        self.records_to_modify = pd.DataFrame(columns=MODIFY_COLUMNS)
+
     def analyze(self):
         """Run complete analysis and categorize all records"""
         print("=" * 80)
         print("SOURCE 7 CLEANUP ANALYSIS - REVISED APPROACH")
         print("=" * 80)
         print(f"Total records to analyze: {len(self.source_7_df)}")
-        
-        # Analyze each record
-        for idx, row in self.source_7_df.iterrows():
-            self.categorize_record(idx, row)
-            
+
+        # Classify every record in a single vectorized pass
+        if self.n_jobs > 1 and len(self.source_7_df) > self.n_jobs:
+            self.analysis_df = categorize_records_parallel(self.source_7_df, self.n_jobs)
+        else:
+            self.analysis_df = categorize_records(self.source_7_df)
+        self.split_by_action(self.analysis_df)
+
         # Generate reports
         self.generate_csv_reports()
         self.generate_summary()
-        
-    def categorize_record(self, idx, row):
-        """Categorize each record into keep/remove/modify"""
-        context = str(row['context']).lower()
-        value = row['value']
-        unit = row['unit']
-        metric_type = row['metric_type']
-        
-        # Check for energy_unit errors first (definite removal)
-        if unit == 'energy_unit':
-            self.records_to_remove.append({
-                'original_id': idx,
-                'value': value,
-                'unit': unit,
-                'year': row['year'],
-                'metric_type': metric_type,
-                'context_preview': context[:100] + '...' if len(context) > 100 else context,
-                'reason': 'Energy unit is actually a citation year from references',
-                'confidence': 0.95
-            })
-            return
-            
-        # Check if this is structured sector data
-        is_sector_data = self.is_sector_comparison_data(context)
-        
-        if is_sector_data:
-            # This is valuable sector comparison data - modify to enrich
-            sector_info = self.extract_sector_info(context)
-            
-            # Determine new metric type based on context
-            new_metric_type = 'adoption_metric'  # Most sector comparisons are about adoption
-            
-            # Check for duplicates in sector data
-            if self.is_duplicate_sector_data(row, sector_info):
-                self.records_to_remove.append({
-                    'original_id': idx,
-                    'value': value,
-                    'unit': unit,
-                    'year': row['year'],
-                    'metric_type': metric_type,
-                    'context_preview': context[:100] + '...' if len(context) > 100 else context,
-                    'reason': 'Duplicate sector comparison data (same country/sector/size/value)',
-                    'confidence': 0.85
-                })
-            else:
-                self.records_to_modify.append({
-                    'original_id': idx,
-                    'value': value,
-                    'unit': unit,
-                    'year': row['year'],
-                    'current_metric_type': metric_type,
-                    'new_metric_type': new_metric_type,
-                    'context_preview': context[:100] + '...' if len(context) > 100 else context,
-                    'sector': sector_info.get('sector', ''),
-                    'country': sector_info.get('country', ''),
-                    'company_size': sector_info.get('size', ''),
-                    'reason': 'Sector comparison data - enrich with metadata',
-                    'confidence': 0.90
-                })
-        else:
-            # Not sector data - check other criteria
-            action = self.determine_action_for_non_sector_data(idx, row)
-            
-            if action['action'] == 'keep':
-                self.records_to_keep.append({
-                    'original_id': idx,
-                    'value': value,
-                    'unit': unit,
-                    'year': row['year'],
-                    'metric_type': metric_type,
-                    'context_preview': context[:100] + '...' if len(context) > 100 else context,
-                    'reason': action['reason'],
-                    'confidence': action['confidence']
-                })
-            elif action['action'] == 'remove':
-                self.records_to_remove.append({
-                    'original_id': idx,
-                    'value': value,
-                    'unit': unit,
-                    'year': row['year'],
-                    'metric_type': metric_type,
-                    'context_preview': context[:100] + '...' if len(context) > 100 else context,
-                    'reason': action['reason'],
-                    'confidence': action['confidence']
-                })
-            elif action['action'] == 'modify':
-                self.records_to_modify.append({
-                    'original_id': idx,
-                    'value': value,
-                    'unit': unit,
-                    'year': row['year'],
-                    'current_metric_type': metric_type,
-                    'new_metric_type': action['new_metric_type'],
-                    'context_preview': context[:100] + '...' if len(context) > 100 else context,
-                    'sector': '',
-                    'country': '',
-                    'company_size': '',
-                    'reason': action['reason'],
-                    'confidence': action['confidence']
-                })
-                
-    def is_sector_comparison_data(self, context):
-        """Check if this record contains sector comparison data"""
-        sector_indicators = [
-            r'ict.*manufacturing|manufacturing.*ict',
-            r'50-249|250\+',
-            r'\b(deu|fra|ita|jpn|can)\b.*\d+\s*\(',
-            r'\d+\s*\(\d+\.\d+%\)'
-        ]
-        
-        matches = sum(1 for pattern in sector_indicators if re.search(pattern, context, re.IGNORECASE))
-        return matches >= 2  # Need at least 2 indicators
-        
-    def extract_sector_info(self, context):
-        """Extract structured information from sector data"""
-        info = {}
-        
-        # Extract country
-        country_map = {
-            'deu': 'Germany',
-            'fra': 'France', 
-            'ita': 'Italy',
-            'jpn': 'Japan',
-            'can': 'Canada'
-        }
-        for code, name in country_map.items():
-            if code in context.lower():
-                info['country'] = name
-                break
-                
-        # Extract sector
-        if 'ict' in context.lower() and 'manufacturing' not in context.lower()[:20]:
-            info['sector'] = 'ICT'
-        elif 'manufacturing' in context.lower() and 'ict' not in context.lower()[:20]:
-            info['sector'] = 'Manufacturing'
-            
-        # Extract company size
-        if '50-249' in context:
-            info['size'] = '50-249'
-        elif '250+' in context or '250\+' in context:
-            info['size'] = '250+'
-            
-        return info
-        
-    def is_duplicate_sector_data(self, row, sector_info):
-        """Check if this sector data is a duplicate"""
-        # For now, simple check - could be enhanced
-        # Check if same value appears multiple times for same country/sector/size
-        if row['value'] == 0.0 and row['unit'] == 'percentage':
-            # Many 0.0% values are from table formatting, not real data
-            if len(row['context']) < 100:  # Short contexts are often fragments
-                return True
-        return False
-        
-    def determine_action_for_non_sector_data(self, idx, row):
-        """Determine action for records that aren't sector comparisons"""
-        context = str(row['context']).lower()
-        value = row['value']
-        unit = row['unit']
-        metric_type = row['metric_type']
-        
-        # Employment-related metrics
-        if any(word in context for word in ['employment', 'jobs', 'occupation', 'worker', 'labor']):
-            if metric_type != 'employment_metric':
-                return {
-                    'action': 'modify',
-                    'new_metric_type': 'employment_metric',
-                    'reason': 'Context indicates employment-related metric',
-                    'confidence': 0.85
-                }
-            else:
-                return {
-                    'action': 'keep',
-                    'reason': 'Properly classified employment metric',
-                    'confidence': 0.90
-                }
-                
-        # Productivity metrics
-        elif any(word in context for word in ['productivity', 'efficiency', 'output', 'performance']):
-            if metric_type != 'productivity_metric':
-                return {
-                    'action': 'modify',
-                    'new_metric_type': 'productivity_metric',
-                    'reason': 'Context indicates productivity-related metric',
-                    'confidence': 0.85
-                }
-            else:
-                return {
-                    'action': 'keep',
-                    'reason': 'Properly classified productivity metric',
-                    'confidence': 0.90
-                }
-                
-        # Check for meaningless 0.0% not in sector data
-        elif value == 0.0 and unit == 'percentage' and len(context) < 50:
-            return {
-                'action': 'remove',
-                'reason': 'Fragment with 0.0% - likely parsing error',
-                'confidence': 0.80
-            }
-            
-        # General rates that need classification
-        elif metric_type == 'general_rate':
-            # Try to classify based on context
-            if 'growth' in context or 'increase' in context:
-                return {
-                    'action': 'modify',
-                    'new_metric_type': 'growth_metric',
-                    'reason': 'Context indicates growth metric',
-                    'confidence': 0.75
-                }
-            elif 'adopt' in context or 'usage' in context:
-                return {
-                    'action': 'modify', 
-                    'new_metric_type': 'adoption_metric',
-                    'reason': 'Context indicates adoption metric',
-                    'confidence': 0.75
-                }
-            else:
-                return {
-                    'action': 'keep',
-                    'reason': 'General rate - needs manual review for classification',
-                    'confidence': 0.50
-                }
-        else:
-            # Default - keep with current classification
-            return {
-                'action': 'keep',
-                'reason': 'No issues detected',
-                'confidence': 0.70
-            }
-            
+
+    def split_by_action(self, analysis_df):
+        """Split the classified frame into the keep/remove/modify record sets"""
+        action = analysis_df['action']
+        self.records_to_keep = analysis_df.loc[action == 'keep', KEEP_COLUMNS]
+        self.records_to_remove = analysis_df.loc[action == 'remove', KEEP_COLUMNS]
+        self.records_to_modify = (
+            analysis_df.loc[action == 'modify']
+            .rename(columns={'metric_type': 'current_metric_type'})[MODIFY_COLUMNS]
+        )
+
     def generate_csv_reports(self):
         """Generate the three CSV files"""
         output_dir = "Source Data Cleanup Analysis/Source_7"
-        
+
         # Records to keep
-        if self.records_to_keep:
-            keep_df = pd.DataFrame(self.records_to_keep)
-            keep_df.to_csv(f"{output_dir}/records_to_keep.csv", index=False)
+        if len(self.records_to_keep):
+            self.records_to_keep.to_csv(f"{output_dir}/records_to_keep.csv", index=False)
             print(f"\nRecords to keep: {len(self.records_to_keep)}")
-            
+
         # Records to remove
-        if self.records_to_remove:
-            remove_df = pd.DataFrame(self.records_to_remove)
-            remove_df.to_csv(f"{output_dir}/records_to_remove.csv", index=False)
+        if len(self.records_to_remove):
+            self.records_to_remove.to_csv(f"{output_dir}/records_to_remove.csv", index=False)
             print(f"Records to remove: {len(self.records_to_remove)}")
-            
+
         # Records to modify
-        if self.records_to_modify:
-            modify_df = pd.DataFrame(self.records_to_modify)
-            modify_df.to_csv(f"{output_dir}/records_to_modify.csv", index=False)
+        if len(self.records_to_modify):
+            self.records_to_modify.to_csv(f"{output_dir}/records_to_modify.csv", index=False)
             print(f"Records to modify: {len(self.records_to_modify)}")
-            
-        # Initial analysis (all records with proposed actions)
-        all_records = []
-        
-        for record in self.records_to_keep:
-            record['proposed_action'] = 'KEEP'
-            all_records.append(record)
-            
-        for record in self.records_to_remove:
-            record['proposed_action'] = 'REMOVE'
-            all_records.append(record)
-            
-        for record in self.records_to_modify:
-            record['proposed_action'] = 'MODIFY'
-            # Flatten the modify records for the combined view
-            flat_record = {
-                'original_id': record['original_id'],
-                'value': record['value'],
-                'unit': record['unit'],
-                'year': record['year'],
-                'metric_type': record['current_metric_type'],
-                'context_preview': record['context_preview'],
-                'reason': record['reason'],
-                'confidence': record['confidence'],
-                'proposed_action': 'MODIFY'
-            }
-            all_records.append(flat_record)
-            
-        # Sort by original ID to maintain order
-        all_records_df = pd.DataFrame(all_records).sort_values('original_id')
+
+        # Initial analysis (all records with proposed actions), already in original ID order
+        all_records_df = self.analysis_df[KEEP_COLUMNS].assign(
+            proposed_action=self.analysis_df['action'].str.upper()
+        )
         all_records_df.to_csv(f"{output_dir}/initial_analysis.csv", index=False)
-        
+
     def generate_summary(self):
         """Generate summary text file"""
         output_dir = "Source Data Cleanup Analysis/Source_7"
-        
+
         summary = f"""SOURCE 7 CLEANUP ANALYSIS SUMMARY
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
@@ -332,36 +256,31 @@ PROPOSED ACTIONS:
 
 REMOVAL REASONS:
 """
-        # Count removal reasons
-        removal_reasons = {}
-        for record in self.records_to_remove:
-            reason = record['reason']
-            removal_reasons[reason] = removal_reasons.get(reason, 0) + 1
-            
+        # Count removal reasons (in order of first occurrence)
+        removal_reasons = self.records_to_remove.groupby('reason', sort=False).size()
         for reason, count in removal_reasons.items():
             summary += f"  - {reason}: {count} records\n"
-            
+
         summary += "\nMODIFICATION SUMMARY:\n"
-        
+
         # Count modification types
-        mod_types = {}
-        for record in self.records_to_modify:
-            change = f"{record['current_metric_type']} → {record['new_metric_type']}"
-            mod_types[change] = mod_types.get(change, 0) + 1
-            
-        for change, count in mod_types.items():
+        changes = (self.records_to_modify['current_metric_type'] + ' → '
+                   + self.records_to_modify['new_metric_type'])
+        for change, count in changes.groupby(changes, sort=False).size().items():
             summary += f"  - {change}: {count} records\n"
-            
+
+        removal_reason = self.records_to_remove['reason']
+        confidence = self.analysis_df['confidence']
         summary += f"""
 KEY INSIGHTS:
-1. Identified {sum(1 for r in self.records_to_modify if r.get('sector'))} sector comparison records
-2. Found {sum(1 for r in self.records_to_remove if 'energy_unit' in r['reason'])} energy_unit errors
-3. Detected {sum(1 for r in self.records_to_remove if 'Duplicate' in r['reason'])} duplicate records
+1. Identified {(self.records_to_modify['sector'] != '').sum()} sector comparison records
+2. Found {removal_reason.str.contains('energy_unit', regex=False).sum()} energy_unit errors
+3. Detected {removal_reason.str.contains('Duplicate', regex=False).sum()} duplicate records
 
 CONFIDENCE DISTRIBUTION:
-- High confidence (>0.85): {sum(1 for r in self.records_to_keep + self.records_to_remove + self.records_to_modify if r['confidence'] > 0.85)} records
-- Medium confidence (0.70-0.85): {sum(1 for r in self.records_to_keep + self.records_to_remove + self.records_to_modify if 0.70 <= r['confidence'] <= 0.85)} records  
-- Low confidence (<0.70): {sum(1 for r in self.records_to_keep + self.records_to_remove + self.records_to_modify if r['confidence'] < 0.70)} records
+- High confidence (>0.85): {(confidence > 0.85).sum()} records
+- Medium confidence (0.70-0.85): {confidence.between(0.70, 0.85).sum()} records
+- Low confidence (<0.70): {(confidence < 0.70).sum()} records
 
 NEXT STEPS:
 1. Review the CSV files to validate proposed actions
@@ -369,24 +288,28 @@ NEXT STEPS:
 3. Confirm sector data identification is accurate
 4. Approve or modify the cleanup plan before execution
 """
-        
+
         with open(f"{output_dir}/cleanup_summary.txt", 'w', encoding='utf-8') as f:
             f.write(summary)
-            
+
         print(f"\nSummary saved to: {output_dir}/cleanup_summary.txt")
-        
+
 
 if __name__ == "__main__":
-    analyzer = Source7CleanupAnalyzer()
+    n_jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    if n_jobs < 1:
+        n_jobs = os.cpu_count() or 1
+
+    analyzer = Source7CleanupAnalyzer(n_jobs=n_jobs)
     analyzer.analyze()
-    
+
     print("\n" + "=" * 80)
     print("ANALYSIS COMPLETE")
     print("=" * 80)
     print("\nFiles created in 'Source Data Cleanup Analysis/Source_7/':")
     print("  - initial_analysis.csv (all records with proposed actions)")
     print("  - records_to_keep.csv")
-    print("  - records_to_remove.csv") 
+    print("  - records_to_remove.csv")
     print("  - records_to_modify.csv")
     print("  - cleanup_summary.txt")
-    print("\nPlease review these files before proceeding with cleanup.")
\ No newline at end of file
+    print("\nPlease review these files before proceeding with cleanup.")
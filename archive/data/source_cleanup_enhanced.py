@@ -7,14 +7,169 @@ import pandas as pd
 import numpy as np
 import re
 import os
+import sys
 import json
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from metric_validator import MetricValidator
 from quality_tracker import QualityTracker
 
 
+# Columns the analysis reads from the cleaned metrics file
+ANALYSIS_COLUMNS = ['source_id', 'metric_type', 'value', 'unit', 'year', 'context']
+
+# Sector patterns in priority order; the first one that matches wins
+SECTOR_PATTERNS = {
+    'financial services': r'\b(?:financ|bank|insurance|fintech|investment|asset\s+manag)',
+    'healthcare': r'\b(?:health|medic|pharma|clinical|hospital|patient|therap)',
+    'retail': r'\b(?:retail|e-commerce|shopping|consumer\s+goods|store|merchandise)',
+    'manufacturing': r'\b(?:manufactur|industrial|production|factory|assembly)',
+    'technology': r'\b(?:tech|software|IT|digital|cyber|cloud|data\s+center)',
+    'education': r'\b(?:educat|academic|university|school|learn|train|student)',
+    'government': r'\b(?:government|public\s+sector|federal|municipal|state\s+agency)',
+    'energy': r'\b(?:energy|utility|power|renewable|oil|gas|electric)',
+    'transportation': r'\b(?:transport|logistics|shipping|delivery|airline|automotive)'
+}
+SECTOR_REGEXES = [(sector, re.compile(pattern)) for sector, pattern in SECTOR_PATTERNS.items()]
+ANY_SECTOR_REGEX = re.compile('|'.join(SECTOR_PATTERNS.values()))
+
+# Metric types too vague to keep without trying to reclassify them
+VAGUE_METRIC_TYPES = ['general_rate', 'general_metric', 'unknown_metric']
+
+# Records sharing this key are duplicates of the first occurrence
+DUPLICATE_KEY = ['value', 'unit', 'year']
+
+# Rows per chunk when streaming the cleaned metrics file
+READ_CHUNK_ROWS = 250_000
+
+# Confidence buckets: low < 0.70 <= medium <= 0.85 < high
+CONFIDENCE_BINS = [-np.inf, 0.70, np.nextafter(0.85, np.inf), np.inf]
+
+# Structural categories, resolved before any validator rule runs
+VALIDATE, INCOMPLETE, ICT, CITATION, DUPLICATE = range(5)
+
+# Summary labels for removal reasons whose record text carries extra detail
+REASON_LABELS = {
+    'Incomplete record - missing value, unit, or year': 'Incomplete record',
+    'Duplicate record (keeping first occurrence)': 'Duplicate record'
+}
+RECLASSIFY_PREFIX = 'Reclassify: '
+
+
+def structural_codes(values: np.ndarray, years: np.ndarray, unit_missing: np.ndarray,
+                     ict: np.ndarray, duplicate: np.ndarray) -> np.ndarray:
+    """
+    Assign every row its structural category from plain arrays
+    
+    Checks apply in categorize_record order: incomplete, ICT, citation year,
+    duplicate. CITATION only marks candidates (an in-range value equal to
+    the year); the caller confirms them against the context.
+    
+    Returns:
+        int8 array of category codes, VALIDATE for rows needing the validator
+    """
+    incomplete = np.isnan(values) | np.isnan(years) | unit_missing
+    citation = (values >= 1900) & (values <= 2030) & (values == years)
+    return np.select(
+        [incomplete, ict, citation, duplicate],
+        [INCOMPLETE, ICT, CITATION, DUPLICATE],
+        default=VALIDATE
+    ).astype(np.int8)
+
+
+def category_labels(column: pd.Series) -> List[str]:
+    """Decode a categorical column to plain strings, 'nan' for missing values
+    
+    Missing values get the 'nan' that str() gives them, as in the reasons
+    and reports written before the columns were categorical.
+    """
+    labels = np.append(column.cat.categories.astype(str).to_numpy(dtype=object), 'nan')
+    return labels[column.cat.codes.to_numpy()].tolist()
+
+
+class RecordColumns:
+    """
+    Column-oriented store for one category of analyzed records
+    
+    A record is its row position in the analyzed frame plus the fields
+    decided during categorization, each kept in its own preallocated array.
+    Row fields (value, unit, year, ...) are gathered from the frame's
+    columns only when the records are turned into a DataFrame.
+    """
+    
+    def __init__(self, capacity: int, extra_fields: Dict[str, object] = None):
+        """
+        Args:
+            capacity: Initial number of records to allocate room for
+            extra_fields: Category-specific fields mapped to their default value
+        """
+        self.size = 0
+        self.defaults = dict(extra_fields or {})
+        self.positions = np.empty(capacity, dtype=np.int64)
+        self.reasons = np.empty(capacity, dtype=object)
+        self.confidences = np.empty(capacity, dtype=np.float64)
+        self.extra = {name: np.empty(capacity, dtype=object) for name in self.defaults}
+        
+    def __len__(self) -> int:
+        return self.size
+        
+    def _reserve(self, count: int):
+        """Grow the arrays so count more records fit"""
+        needed = self.size + count
+        if needed <= len(self.positions):
+            return
+        capacity = max(needed, 2 * len(self.positions))
+        self.positions = np.resize(self.positions, capacity)
+        self.reasons = np.resize(self.reasons, capacity)
+        self.confidences = np.resize(self.confidences, capacity)
+        self.extra = {name: np.resize(values, capacity) for name, values in self.extra.items()}
+        
+    def append(self, pos: int, reason: str, confidence: float, **extra):
+        """
+        Add a single record
+        
+        Reasons are interned, so records sharing a validator reason reuse one
+        string object instead of each holding a freshly formatted copy.
+        """
+        self._reserve(1)
+        i = self.size
+        self.positions[i] = pos
+        self.reasons[i] = sys.intern(reason)
+        self.confidences[i] = confidence
+        for name, default in self.defaults.items():
+            self.extra[name][i] = extra.get(name, default)
+        self.size += 1
+        
+    def extend(self, positions, reason, confidence, **extra):
+        """Add records in bulk; reason, confidence and extras may be scalars or arrays"""
+        count = len(positions)
+        if count == 0:
+            return
+        self._reserve(count)
+        span = slice(self.size, self.size + count)
+        self.positions[span] = positions
+        self.reasons[span] = reason
+        self.confidences[span] = confidence
+        for name, default in self.defaults.items():
+            self.extra[name][span] = extra.get(name, default)
+        self.size += count
+        
+    def sorted_view(self) -> Dict[str, np.ndarray]:
+        """Return the filled arrays ordered by row position"""
+        order = np.argsort(self.positions[:self.size], kind='stable')
+        view = {
+            'positions': self.positions[:self.size][order],
+            'reason': self.reasons[:self.size][order],
+            'confidence': self.confidences[:self.size][order]
+        }
+        for name, values in self.extra.items():
+            view[name] = values[:self.size][order]
+        return view
+
+
 class EnhancedSourceAnalyzer:
     def __init__(self, source_id: int, previous_cleaned_file: str = 'ai_metrics.csv',
                  data_sources_file: str = 'data/exports/data_sources_20250719.csv'):
@@ -32,8 +187,12 @@ class EnhancedSourceAnalyzer:
         
         # Load data
         self.source_id = source_id
-        self.df = pd.read_csv(previous_cleaned_file)
-        self.source_df = self.df[self.df['source_id'] == source_id].copy()
+        self.output_dir = f"Source Data Cleanup Analysis/Source_{source_id}"
+        self.source_df = self._read_source_rows(previous_cleaned_file)
+        
+        # Low-cardinality labels compare and hash as small integer codes
+        for column in ('unit', 'metric_type'):
+            self.source_df[column] = self.source_df[column].astype('category')
         
         # Get source metadata
         try:
@@ -42,78 +201,119 @@ class EnhancedSourceAnalyzer:
         except:
             self.source_name = f"Source_{source_id}"
             
+        # Column arrays that records are gathered from
+        self._prepare_columns()
+        
         # Initialize tracking
-        self.records_to_keep = []
-        self.records_to_remove = []
-        self.records_to_modify = []
-        self.duplicate_groups = {}
-        
-        # Statistics for quality tracking
-        self.removal_reasons = {}
-        self.modification_types = {}
-        
-    def analyze(self):
-        """Run complete analysis with quality tracking"""
-        print("=" * 80)
-        print(f"SOURCE {self.source_id} ENHANCED CLEANUP ANALYSIS")
-        print(f"File: {self.source_name}")
-        print(f"Schema Version: 1.1")
-        print("=" * 80)
-        print(f"Total records to analyze: {len(self.source_df)}")
+        capacity = len(self.source_df)
+        self._keep = RecordColumns(capacity)
+        self._remove = RecordColumns(capacity, {'kept_record_id': np.nan})
+        self._modify = RecordColumns(capacity, {'new_metric_type': '', 'sector': ''})
+        self._dup_remove_mask = None
+        self._dup_first_ids = None
+        self._log = None
+        self.last_output = ''
+        self._dup_group_ids = None
+        self._dup_group_sizes = np.zeros(0, dtype=np.int64)
+        self._duplicate_groups = None
+        
+    def analyze(self, track_quality: bool = True, echo: bool = True) -> Optional[Dict]:
+        """
+        Run complete analysis with quality tracking
+        
+        Args:
+            track_quality: Record the results in the quality tracker. Parallel
+                runs pass False and record the returned results afterwards,
+                so only one process appends to the tracking file.
+            echo: Print status lines as the analysis goes. With False they
+                are only buffered into last_output, so parallel runs can
+                print each source's report without interleaving.
+            
+        Returns:
+            Quality tracker results for this source, or None if it has no records
+        """
+        if echo:
+            self.last_output = ''
+            return self._run_analysis(track_quality)
+            
+        self._log = []
+        try:
+            return self._run_analysis(track_quality)
+        finally:
+            self.last_output = ''.join(f'{line}\n' for line in self._log)
+            self._log = None
+                
+    def _run_analysis(self, track_quality: bool) -> Optional[Dict]:
+        """The analysis phases run by analyze()"""
+        self._say("=" * 80)
+        self._say(f"SOURCE {self.source_id} ENHANCED CLEANUP ANALYSIS")
+        self._say(f"File: {self.source_name}")
+        self._say(f"Schema Version: 1.1")
+        self._say("=" * 80)
+        self._say(f"Total records to analyze: {len(self.source_df)}")
         
         if len(self.source_df) == 0:
-            print("No records found for this source.")
-            return
+            self._say("No records found for this source.")
+            return None
             
         # Analysis phases
         self.print_initial_analysis()
         self.identify_duplicate_groups()
         
         # Process records
-        for idx, row in self.source_df.iterrows():
-            self.categorize_record(idx, row)
+        self.categorize_records()
             
         # Generate outputs
         self.generate_csv_reports()
         summary_data = self.generate_enhanced_summary()
         
         # Track quality metrics
-        self._track_quality_metrics()
+        quality_results = self._quality_results(summary_data)
+        if track_quality:
+            self._track_quality_metrics(quality_results)
         
         # Export summary in multiple formats
         self.export_summary(summary_data)
+        return quality_results
         
+    def _say(self, message: str = ''):
+        """Buffer a status line during a non-echoing analyze(), print it otherwise"""
+        if self._log is None:
+            print(message)
+        else:
+            self._log.append(message)
+            
     def print_initial_analysis(self):
         """Print initial data analysis with insights"""
-        print("\nINITIAL DATA ANALYSIS:")
-        print("-" * 40)
+        self._say("\nINITIAL DATA ANALYSIS:")
+        self._say("-" * 40)
         
         # Metric type distribution
-        print("\nMetric Type Distribution:")
+        self._say("\nMetric Type Distribution:")
         metric_dist = self.source_df['metric_type'].value_counts()
         for metric, count in metric_dist.head(10).items():
             pct = count/len(self.source_df)*100
-            print(f"  {metric}: {count} ({pct:.1f}%)")
+            self._say(f"  {metric}: {count} ({pct:.1f}%)")
             
         # Unit distribution with warnings
-        print("\nUnit Distribution:")
+        self._say("\nUnit Distribution:")
         unit_dist = self.source_df['unit'].value_counts()
         problem_units = ['energy_unit', 'unknown', 'multiple', 'co2_emissions']
         
         for unit, count in unit_dist.head(10).items():
             warning = " [WARNING: PROBLEMATIC]" if unit in problem_units else ""
-            print(f"  {unit}: {count}{warning}")
+            self._say(f"  {unit}: {count}{warning}")
             
         # Year distribution
-        print("\nYear Distribution:")
+        self._say("\nYear Distribution:")
         year_dist = self.source_df['year'].value_counts().sort_index()
         if len(year_dist) > 0:
-            print(f"  Range: {year_dist.index.min()} - {year_dist.index.max()}")
+            self._say(f"  Range: {year_dist.index.min()} - {year_dist.index.max()}")
             
         # Value patterns
-        print("\nValue Analysis:")
+        self._say("\nValue Analysis:")
         zero_count = (self.source_df['value'] == 0).sum()
-        print(f"  Zero values: {zero_count} ({zero_count/len(self.source_df)*100:.1f}%)")
+        self._say(f"  Zero values: {zero_count} ({zero_count/len(self.source_df)*100:.1f}%)")
         
         # Potential citation years
         potential_citations = self.source_df[
@@ -122,263 +322,417 @@ class EnhancedSourceAnalyzer:
             (self.source_df['value'] == self.source_df['year'])
         ]
         if len(potential_citations) > 0:
-            print(f"  [WARNING] Potential citation years: {len(potential_citations)} records")
+            self._say(f"  [WARNING] Potential citation years: {len(potential_citations)} records")
             
     def identify_duplicate_groups(self):
         """Identify duplicate groups with enhanced reporting"""
-        self.duplicate_groups = {}
-        
-        # Group by value/unit/year
-        grouped = self.source_df.groupby(['value', 'unit', 'year'])
-        
-        for (value, unit, year), group in grouped:
-            if len(group) > 1:
-                sorted_group = group.sort_index()
-                self.duplicate_groups[(value, unit, year)] = {
-                    'first': sorted_group.index[0],
-                    'duplicates': sorted_group.index[1:].tolist(),
-                    'count': len(group)
-                }
+        self._find_duplicates()
+        repeated = np.flatnonzero(self._dup_group_sizes > 1)
                 
-        print(f"\nDuplicate Analysis:")
-        print(f"  Duplicate groups found: {len(self.duplicate_groups)}")
-        print(f"  Total duplicate records: {sum(d['count']-1 for d in self.duplicate_groups.values())}")
-        
-        if self.duplicate_groups:
-            print("\n  Sample duplicate groups:")
-            for i, ((value, unit, year), info) in enumerate(list(self.duplicate_groups.items())[:3]):
-                print(f"\n  Group {i+1}: value={value}, unit={unit}, year={year}")
-                print(f"    - Total occurrences: {info['count']}")
-                print(f"    - Keeping record ID: {info['first']}")
-                print(f"    - Removing record IDs: {info['duplicates'][:3]}{'...' if len(info['duplicates']) > 3 else ''}")
+        self._say(f"\nDuplicate Analysis:")
+        self._say(f"  Duplicate groups found: {self.duplicate_group_count}")
+        self._say(f"  Total duplicate records: {self.duplicates_removed_count}")
+        
+        if len(repeated):
+            self._say("\n  Sample duplicate groups:")
+            for i, group in enumerate(repeated[:3]):
+                positions = np.flatnonzero(self._dup_group_ids == group)
+                value, unit, year = self._group_key(positions[0])
+                duplicates = self._index[positions[1:]].tolist()
+                self._say(f"\n  Group {i+1}: value={value}, unit={unit}, year={year}")
+                self._say(f"    - Total occurrences: {len(positions)}")
+                self._say(f"    - Keeping record ID: {self._index[positions[0]]}")
+                self._say(f"    - Removing record IDs: {duplicates[:3]}{'...' if len(duplicates) > 3 else ''}")
                 
-    def categorize_record(self, idx: int, row: pd.Series):
-        """Categorize record with defensive checks and validation"""
+    def _find_duplicates(self):
+        """Flag every repeat of (value, unit, year) after its first occurrence"""
+        df = self.source_df
+        grouped = pd.Series(df.index, index=df.index).groupby(
+            [df[col] for col in DUPLICATE_KEY], observed=True)
+        self._dup_remove_mask = df.duplicated(subset=DUPLICATE_KEY, keep='first').to_numpy()
+        self._dup_first_ids = grouped.transform('first').to_numpy()
+        
+        # Group numbers follow sorted key order; rows with a missing key get -1
+        self._dup_group_ids = grouped.ngroup().fillna(-1).to_numpy(dtype=np.int64)
+        self._dup_group_sizes = np.bincount(self._dup_group_ids[self._dup_group_ids >= 0],
+                                            minlength=grouped.ngroups)
+        self._duplicate_groups = None
+        
+    def _group_key(self, pos: int):
+        """The (value, unit, year) duplicate key of the row at pos"""
+        return tuple(self.source_df[col].iat[pos] for col in DUPLICATE_KEY)
+        
+    @property
+    def duplicate_group_count(self) -> int:
+        """Number of (value, unit, year) keys that occur more than once"""
+        return int((self._dup_group_sizes > 1).sum())
+        
+    @property
+    def duplicates_removed_count(self) -> int:
+        """Records beyond the first occurrence across all duplicate groups"""
+        sizes = self._dup_group_sizes
+        return int((sizes[sizes > 1] - 1).sum())
+        
+    @property
+    def duplicate_groups(self) -> Dict:
+        """Repeated keys mapped to their first record id and occurrence count
+        
+        Only the aggregate counts are kept during analysis; this mapping is
+        built on first access.
+        """
+        if self._duplicate_groups is None:
+            groups = {}
+            if self._dup_group_ids is not None:
+                repeated = self._dup_group_sizes > 1
+                grouped = self._dup_group_ids >= 0
+                # First row position of each group, in group id order
+                group_ids, first_index = np.unique(self._dup_group_ids[grouped],
+                                                   return_index=True)
+                first_positions = np.flatnonzero(grouped)[first_index]
+                for group, pos in zip(group_ids, first_positions):
+                    if not repeated[group]:
+                        continue
+                    groups[self._group_key(pos)] = {
+                        'first': self._index[pos],
+                        'count': int(self._dup_group_sizes[group])
+                    }
+            self._duplicate_groups = groups
+        return self._duplicate_groups
+        
+    def _read_source_rows(self, path: str) -> pd.DataFrame:
+        """
+        Stream the metrics file and keep only this source's rows
+        
+        Peak memory follows the source's slice rather than the whole file.
+        Chunk indexes continue across chunks, so row ids match a full read.
+        """
+        chunks = pd.read_csv(path, usecols=ANALYSIS_COLUMNS, dtype={'value': 'float64'},
+                             chunksize=READ_CHUNK_ROWS)
+        return pd.concat([chunk[chunk['source_id'] == self.source_id] for chunk in chunks])
+        
+    def _prepare_columns(self):
+        """Extract the typed column arrays shared by categorization and reporting"""
+        df = self.source_df
+        self._index = df.index.to_numpy()
+        self._values = df['value'].to_numpy(dtype=np.float64)
+        self._years = df['year'].to_numpy(dtype=np.float64)
+        self._units = np.asarray(df['unit'], dtype=object)
+        self._metric_types = np.asarray(df['metric_type'], dtype=object)
+        
+        # Plain Python scalars for the per-record validator calls; missing
+        # years become -1, which only incomplete (never validated) rows carry
+        self._value_list = self._values.tolist()
+        self._year_list = np.nan_to_num(self._years, nan=-1).astype(np.int64).tolist()
+        self._unit_list = category_labels(df['unit'])
+        self._metric_list = category_labels(df['metric_type'])
+        self._contexts = df['context'].fillna('').astype(str)
+        self._contexts_lower = self._contexts.str.lower()
+        self._incomplete = (np.isnan(self._values) | np.isnan(self._years)
+                            | df['unit'].isna().to_numpy())
+        self._previews = np.where(
+            (self._contexts.str.len() > 100).to_numpy(),
+            (self._contexts.str.slice(0, 100) + '...').to_numpy(dtype=object),
+            self._contexts.to_numpy(dtype=object)
+        )
+        self._previews[self._incomplete] = 'Missing required fields'
+        
+    def categorize_records(self):
+        """Categorize all records, resolving the structural checks column-wise
+        
+        Incomplete rows, ICT data, citation years and duplicates are detected
+        over the whole frame by structural_codes(). Only the rows that survive
+        all of them go through the per-record validator rules.
+        """
+        df = self.source_df
+        contexts = self._contexts
+        
+        if self._dup_remove_mask is None:
+            self._find_duplicates()
+        duplicate = self._dup_remove_mask
+        ict = contexts.str.contains(self.validator.ict_regex, regex=True).to_numpy()
+        codes = structural_codes(self._values, self._years, df['unit'].isna().to_numpy(),
+                                 ict, duplicate)
+        
+        value_list = self._value_list
+        year_list = self._year_list
+        unit_list = self._unit_list
+        metric_list = self._metric_list
+        context_list = contexts.tolist()
+        context_lower_list = self._contexts_lower.tolist()
+        
+        # Citation candidates still need their context confirmed
+        for pos in np.flatnonzero(codes == CITATION).tolist():
+            if not self.validator.detect_citation_year(value_list[pos], year_list[pos],
+                                                       context_lower_list[pos]):
+                codes[pos] = DUPLICATE if duplicate[pos] else VALIDATE
+        
+        # Defensive checks
+        incomplete_pos = np.flatnonzero(codes == INCOMPLETE)
+        self._remove.extend(incomplete_pos, 'Incomplete record - missing value, unit, or year', 1.0)
+        
+        # CRITICAL: ICT data - MUST BE PRESERVED
+        self._keep.extend(np.flatnonzero(codes == ICT), 'ICT sector data - preserved', 0.95)
+        
+        citation_pos = np.flatnonzero(codes == CITATION)
+        self._remove.extend(citation_pos, 'Citation year extracted as metric value', 0.95)
+        
+        # Duplicates: every repeat of (value, unit, year) after its first occurrence
+        duplicate_pos = np.flatnonzero(codes == DUPLICATE)
+        self._remove.extend(duplicate_pos, 'Duplicate record (keeping first occurrence)', 0.90,
+                            kept_record_id=self._dup_first_ids[duplicate_pos])
+        
+        # Everything else goes through the validator rules. Sectors are only
+        # reported for reclassified vague metrics, so extract them up front
+        # for just those candidate rows.
+        validate = codes == VALIDATE
+        vague = validate & df['metric_type'].isin(VAGUE_METRIC_TYPES).to_numpy()
+        sectors = np.full(len(df), None, dtype=object)
+        sectors[vague] = self.extract_sectors(contexts[vague])
+        for pos in np.flatnonzero(validate).tolist():
+            self._apply_validation_rules(pos, value_list[pos], unit_list[pos],
+                                         year_list[pos], metric_list[pos], context_list[pos],
+                                         sectors[pos], context_lower_list[pos])
+            
+    def categorize_record(self, idx: int):
+        """
+        Categorize record with defensive checks and validation
+        
+        Args:
+            idx: Index label of the record in source_df; its fields are read
+                from the typed column arrays
+        """
+        pos = self.source_df.index.get_loc(idx)
+        
         # Defensive checks
-        if pd.isna(row['value']) or pd.isna(row['unit']) or pd.isna(row['year']):
-            self.records_to_remove.append({
-                'original_id': idx,
-                'value': row.get('value', np.nan),
-                'unit': row.get('unit', ''),
-                'year': row.get('year', np.nan),
-                'metric_type': row.get('metric_type', ''),
-                'context_preview': 'Missing required fields',
-                'reason': 'Incomplete record - missing value, unit, or year',
-                'confidence': 1.0
-            })
-            self._track_removal_reason('Incomplete record')
+        if self._incomplete[pos]:
+            self._remove.append(pos, 'Incomplete record - missing value, unit, or year', 1.0)
             return
             
-        # Extract and clean values
-        context = str(row.get('context', ''))
-        context_lower = context.lower()
-        value = float(row['value'])
-        unit = str(row['unit'])
-        metric_type = str(row['metric_type'])
-        year = int(row['year'])
+        # Typed values come from the column arrays, not per-row coercion
+        context = self._contexts.iat[pos]
+        context_lower = self._contexts_lower.iat[pos]
+        value = self._value_list[pos]
+        unit = self._unit_list[pos]
+        metric_type = self._metric_list[pos]
+        year = self._year_list[pos]
         
         # CRITICAL: Check for ICT data - MUST BE PRESERVED
         if self.validator.is_ict_data(context):
-            self.records_to_keep.append({
-                'original_id': idx,
-                'value': value,
-                'unit': unit,
-                'year': year,
-                'metric_type': metric_type,
-                'context_preview': context[:100] + '...' if len(context) > 100 else context,
-                'reason': 'ICT sector data - preserved',
-                'confidence': 0.95
-            })
+            self._keep.append(pos, 'ICT sector data - preserved', 0.95)
             return
         
         # Check for citation years first
         if self.validator.detect_citation_year(value, year, context_lower):
-            self.records_to_remove.append({
-                'original_id': idx,
-                'value': value,
-                'unit': unit,
-                'year': year,
-                'metric_type': metric_type,
-                'context_preview': context[:100] + '...' if len(context) > 100 else context,
-                'reason': 'Citation year extracted as metric value',
-                'confidence': 0.95
-            })
-            self._track_removal_reason('Citation year extracted as metric value')
+            self._remove.append(pos, 'Citation year extracted as metric value', 0.95)
             return
             
         # Check for duplicates
-        dup_key = (value, unit, year)
-        if dup_key in self.duplicate_groups:
-            dup_info = self.duplicate_groups[dup_key]
-            if idx in dup_info['duplicates']:
-                self.records_to_remove.append({
-                    'original_id': idx,
-                    'value': value,
-                    'unit': unit,
-                    'year': year,
-                    'metric_type': metric_type,
-                    'context_preview': context[:100] + '...' if len(context) > 100 else context,
-                    'reason': 'Duplicate record (keeping first occurrence)',
-                    'kept_record_id': dup_info['first'],  # Add ID of the kept record
-                    'confidence': 0.90
-                })
-                self._track_removal_reason('Duplicate record')
-                return
+        if self._dup_remove_mask is not None and self._dup_remove_mask[pos]:
+            self._remove.append(pos, 'Duplicate record (keeping first occurrence)', 0.90,
+                                kept_record_id=self._dup_first_ids[pos])
+            return
                 
+        self._apply_validation_rules(pos, value, unit, year, metric_type, context,
+                                     context_lower=context_lower)
+        
+    def _apply_validation_rules(self, pos: int, value: float, unit: str, year: int,
+                                metric_type: str, context: str, sector: Optional[str] = None,
+                                context_lower: Optional[str] = None):
+        """
+        Categorize a record that passed the structural checks using the validator
+        
+        Args:
+            pos: Row position of the record in source_df
+            sector: Precomputed sector for the context; extracted on demand if None
+            context_lower: Lowercased context, if the caller already has it
+        """
+        if context_lower is None:
+            context_lower = context.lower()
+            
         # Apply cross-metric validation rules
         cross_issues = self.validator.apply_cross_metric_rules(metric_type, value, unit, year, context)
         if cross_issues:
             highest_issue = max(cross_issues, key=lambda x: x['confidence'])
             if highest_issue.get('action') == 'remove':
-                self.records_to_remove.append({
-                    'original_id': idx,
-                    'value': value,
-                    'unit': unit,
-                    'year': year,
-                    'metric_type': metric_type,
-                    'context_preview': context[:100] + '...' if len(context) > 100 else context,
-                    'reason': highest_issue['reason'],
-                    'confidence': highest_issue['confidence']
-                })
-                self._track_removal_reason(highest_issue['reason'])
+                self._remove.append(pos, highest_issue['reason'], highest_issue['confidence'])
                 return
                 
         # Schema validation
-        schema_issues = self.validator.validate_against_schema(metric_type, value, unit, context)
+        schema_issues = self.validator.validate_against_schema(metric_type, value, unit, context,
+                                                               context_lower)
         if schema_issues:
             highest_issue = max(schema_issues, key=lambda x: x['confidence'])
             if highest_issue['confidence'] >= 0.85:  # High confidence issues
-                self.records_to_remove.append({
-                    'original_id': idx,
-                    'value': value,
-                    'unit': unit,
-                    'year': year,
-                    'metric_type': metric_type,
-                    'context_preview': context[:100] + '...' if len(context) > 100 else context,
-                    'reason': highest_issue['reason'],
-                    'confidence': highest_issue['confidence']
-                })
-                self._track_removal_reason(highest_issue['reason'])
+                self._remove.append(pos, highest_issue['reason'], highest_issue['confidence'])
                 return
                 
         # Check for vague classifications
-        if metric_type in ['general_rate', 'general_metric', 'unknown_metric']:
-            new_type = self.validator.classify_metric_type(context, value, unit, metric_type)
+        if metric_type in VAGUE_METRIC_TYPES:
+            new_type = self.validator.classify_metric_type(context, value, unit, metric_type,
+                                                          context_lower)
             if new_type != metric_type:
-                self.records_to_modify.append({
-                    'original_id': idx,
-                    'value': value,
-                    'unit': unit,
-                    'year': year,
-                    'current_metric_type': metric_type,
-                    'new_metric_type': new_type,
-                    'context_preview': context[:100] + '...' if len(context) > 100 else context,
-                    'sector': self.extract_sector_enhanced(context),
-                    'country': '',
-                    'company_size': '',
-                    'reason': f'Reclassify: {metric_type} -> {new_type}',
-                    'confidence': 0.80
-                })
-                self._track_modification_type(f'{metric_type} -> {new_type}')
+                if sector is None:
+                    sector = self.extract_sector_enhanced(context)
+                self._modify.append(pos, f'{RECLASSIFY_PREFIX}{metric_type} -> {new_type}', 0.80,
+                                    new_metric_type=new_type, sector=sector)
                 return
                 
         # Record passes all checks
-        self.records_to_keep.append({
-            'original_id': idx,
-            'value': value,
-            'unit': unit,
-            'year': year,
-            'metric_type': metric_type,
-            'context_preview': context[:100] + '...' if len(context) > 100 else context,
-            'reason': 'Passed all validation checks',
-            'confidence': 0.85
-        })
+        self._keep.append(pos, 'Passed all validation checks', 0.85)
         
     def extract_sector_enhanced(self, context: str) -> str:
         """Enhanced sector extraction with regex patterns"""
-        # Define sector patterns with regex for better matching
-        sector_patterns = {
-            'financial services': r'\b(?:financ|bank|insurance|fintech|investment|asset\s+manag)',
-            'healthcare': r'\b(?:health|medic|pharma|clinical|hospital|patient|therap)',
-            'retail': r'\b(?:retail|e-commerce|shopping|consumer\s+goods|store|merchandise)',
-            'manufacturing': r'\b(?:manufactur|industrial|production|factory|assembly)',
-            'technology': r'\b(?:tech|software|IT|digital|cyber|cloud|data\s+center)',
-            'education': r'\b(?:educat|academic|university|school|learn|train|student)',
-            'government': r'\b(?:government|public\s+sector|federal|municipal|state\s+agency)',
-            'energy': r'\b(?:energy|utility|power|renewable|oil|gas|electric)',
-            'transportation': r'\b(?:transport|logistics|shipping|delivery|airline|automotive)'
-        }
-        
         context_lower = context.lower()
         
-        for sector, pattern in sector_patterns.items():
-            if re.search(pattern, context_lower):
+        # One scan rules out the common no-sector case
+        if not ANY_SECTOR_REGEX.search(context_lower):
+            return ''
+            
+        for sector, regex in SECTOR_REGEXES:
+            if regex.search(context_lower):
                 return sector
                 
         return ''
         
-    def _track_removal_reason(self, reason: str):
-        """Track removal reasons for reporting"""
-        self.removal_reasons[reason] = self.removal_reasons.get(reason, 0) + 1
+    def extract_sectors(self, contexts: pd.Series) -> np.ndarray:
+        """Vectorized extract_sector_enhanced over a column of contexts"""
+        contexts_lower = contexts.str.lower()
+        return np.select(
+            [contexts_lower.str.contains(regex, regex=True).to_numpy(dtype=bool)
+             for _, regex in SECTOR_REGEXES],
+            [sector for sector, _ in SECTOR_REGEXES],
+            default=''
+        )
+        
+    @property
+    def removal_reasons(self) -> Dict[str, int]:
+        """Removal counts per reason, tallied from the stored reasons"""
+        tally = Counter()
+        tally.update(self._remove.reasons[:self._remove.size])
+        return {REASON_LABELS.get(reason, reason): count for reason, count in tally.items()}
+        
+    @property
+    def modification_types(self) -> Dict[str, int]:
+        """Modification counts per 'old -> new' metric type change"""
+        tally = Counter()
+        tally.update(self._modify.reasons[:self._modify.size])
+        return {reason[len(RECLASSIFY_PREFIX):]: count for reason, count in tally.items()}
+        
+    def _records_frame(self, store: RecordColumns, metric_column: str = 'metric_type') -> pd.DataFrame:
+        """Assemble one record category into a DataFrame, in original row order"""
+        view = store.sorted_view()
+        positions = view.pop('positions')
+        frame = self._row_columns(positions, metric_column)
+        if 'new_metric_type' in view:
+            frame['new_metric_type'] = view['new_metric_type']
+        frame['context_preview'] = self._previews[positions]
+        if 'sector' in view:
+            frame['sector'] = view['sector']
+            frame['country'] = ''
+            frame['company_size'] = ''
+        frame['reason'] = view['reason']
+        if 'kept_record_id' in view and not pd.isna(view['kept_record_id']).all():
+            frame['kept_record_id'] = pd.array(view['kept_record_id'].astype(np.float64), dtype='Int64')
+        frame['confidence'] = view['confidence']
+        return pd.DataFrame(frame)
+        
+    def _row_columns(self, positions: np.ndarray, metric_column: str = 'metric_type') -> Dict:
+        """Gather the source row fields shared by every report for the given positions"""
+        years = self._years[positions]
+        if not np.isnan(years).any():
+            years = years.astype(np.int64)
+        return {
+            'original_id': self._index[positions],
+            'value': self._values[positions],
+            'unit': self._units[positions],
+            'year': years,
+            metric_column: self._metric_types[positions]
+        }
+        
+    def combined_frame(self) -> pd.DataFrame:
+        """All records with their proposed action, in original row order"""
+        stores = {'KEEP': self._keep, 'REMOVE': self._remove, 'MODIFY': self._modify}
+        positions = np.concatenate([store.positions[:store.size] for store in stores.values()])
+        order = np.argsort(positions, kind='stable')
+        positions = positions[order]
+        
+        frame = self._row_columns(positions)
+        frame['context_preview'] = self._previews[positions]
+        frame['reason'] = np.concatenate(
+            [store.reasons[:store.size] for store in stores.values()])[order]
+        frame['confidence'] = np.concatenate(
+            [store.confidences[:store.size] for store in stores.values()])[order]
+        frame['proposed_action'] = np.repeat(
+            list(stores), [len(store) for store in stores.values()])[order]
+        
+        kept_ids = self._remove.extra['kept_record_id'][:self._remove.size].astype(np.float64)
+        if not np.isnan(kept_ids).all():
+            all_kept_ids = np.full(len(positions), np.nan)
+            all_kept_ids[len(self._keep):len(self._keep) + len(self._remove)] = kept_ids
+            frame['kept_record_id'] = pd.array(all_kept_ids[order], dtype='Int64')
+        return pd.DataFrame(frame)
+        
+    def keep_frame(self) -> pd.DataFrame:
+        """Records proposed to keep"""
+        return self._records_frame(self._keep)
+        
+    def remove_frame(self) -> pd.DataFrame:
+        """Records proposed to remove"""
+        return self._records_frame(self._remove)
+        
+    def modify_frame(self) -> pd.DataFrame:
+        """Records proposed to reclassify"""
+        return self._records_frame(self._modify, metric_column='current_metric_type')
+        
+    @property
+    def records_to_keep(self) -> Tuple[Dict, ...]:
+        """Records of keep_frame() as dicts, rebuilt on each access
+        
+        A tuple, so code that still appends to it fails instead of
+        changing a copy; records are added by categorize_records().
+        """
+        return tuple(self.keep_frame().to_dict('records'))
+        
+    @property
+    def records_to_remove(self) -> Tuple[Dict, ...]:
+        """Records of remove_frame() as dicts, in a tuple like records_to_keep"""
+        return tuple(self.remove_frame().to_dict('records'))
+        
+    @property
+    def records_to_modify(self) -> Tuple[Dict, ...]:
+        """Records of modify_frame() as dicts, in a tuple like records_to_keep"""
+        return tuple(self.modify_frame().to_dict('records'))
         
-    def _track_modification_type(self, mod_type: str):
-        """Track modification types for reporting"""
-        self.modification_types[mod_type] = self.modification_types.get(mod_type, 0) + 1
+    def _write_csv(self, frame: pd.DataFrame, filename: str):
+        """Write a report CSV into the source's output directory"""
+        frame.to_csv(os.path.join(self.output_dir, filename), index=False, lineterminator='\n')
         
     def generate_csv_reports(self):
         """Generate CSV output files"""
-        output_dir = f"Source Data Cleanup Analysis/Source_{self.source_id}"
-        os.makedirs(output_dir, exist_ok=True)
+        os.makedirs(self.output_dir, exist_ok=True)
+        
+        keep_df = self.keep_frame()
+        remove_df = self.remove_frame()
+        modify_df = self.modify_frame()
         
         # Save each category
-        if self.records_to_keep:
-            pd.DataFrame(self.records_to_keep).to_csv(
-                f"{output_dir}/records_to_keep.csv", index=False
-            )
+        if len(keep_df):
+            self._write_csv(keep_df, "records_to_keep.csv")
             
-        if self.records_to_remove:
-            pd.DataFrame(self.records_to_remove).to_csv(
-                f"{output_dir}/records_to_remove.csv", index=False
-            )
+        if len(remove_df):
+            self._write_csv(remove_df, "records_to_remove.csv")
             
-        if self.records_to_modify:
-            pd.DataFrame(self.records_to_modify).to_csv(
-                f"{output_dir}/records_to_modify.csv", index=False
-            )
+        if len(modify_df):
+            self._write_csv(modify_df, "records_to_modify.csv")
             
         # Combined analysis file
-        all_records = []
-        for record in self.records_to_keep:
-            record['proposed_action'] = 'KEEP'
-            all_records.append(record)
-            
-        for record in self.records_to_remove:
-            record['proposed_action'] = 'REMOVE'
-            all_records.append(record)
-            
-        for record in self.records_to_modify:
-            flat_record = {
-                'original_id': record['original_id'],
-                'value': record['value'],
-                'unit': record['unit'],
-                'year': record['year'],
-                'metric_type': record['current_metric_type'],
-                'context_preview': record['context_preview'],
-                'reason': record['reason'],
-                'confidence': record['confidence'],
-                'proposed_action': 'MODIFY'
-            }
-            all_records.append(flat_record)
+        if len(keep_df) or len(remove_df) or len(modify_df):
+            self._write_csv(self.combined_frame(), "initial_analysis.csv")
             
-        if all_records:
-            pd.DataFrame(all_records).sort_values('original_id').to_csv(
-                f"{output_dir}/initial_analysis.csv", index=False
-            )
-            
-        print(f"\nOutput Summary:")
-        print(f"  Records to keep: {len(self.records_to_keep)}")
-        print(f"  Records to remove: {len(self.records_to_remove)}")
-        print(f"  Records to modify: {len(self.records_to_modify)}")
+        self._say(f"\nOutput Summary:")
+        self._say(f"  Records to keep: {len(self._keep)}")
+        self._say(f"  Records to remove: {len(self._remove)}")
+        self._say(f"  Records to modify: {len(self._modify)}")
         
     def generate_enhanced_summary(self) -> Dict:
         """Generate comprehensive summary data"""
@@ -388,11 +742,11 @@ class EnhancedSourceAnalyzer:
             'timestamp': datetime.now().isoformat(),
             'schema_version': '1.1',
             'total_records': len(self.source_df),
-            'kept_records': len(self.records_to_keep),
-            'removed_records': len(self.records_to_remove),
-            'modified_records': len(self.records_to_modify),
-            'duplicate_groups': len(self.duplicate_groups),
-            'duplicates_removed': sum(len(d['duplicates']) for d in self.duplicate_groups.values()),
+            'kept_records': len(self._keep),
+            'removed_records': len(self._remove),
+            'modified_records': len(self._modify),
+            'duplicate_groups': self.duplicate_group_count,
+            'duplicates_removed': self.duplicates_removed_count,
             'removal_reasons': dict(sorted(self.removal_reasons.items(), 
                                          key=lambda x: x[1], reverse=True)),
             'modification_types': dict(sorted(self.modification_types.items(), 
@@ -414,22 +768,23 @@ class EnhancedSourceAnalyzer:
         
     def _get_confidence_distribution(self) -> Dict:
         """Calculate confidence score distribution"""
-        all_records = self.records_to_keep + self.records_to_remove + self.records_to_modify
+        confidences = np.concatenate([
+            store.confidences[:store.size] for store in (self._keep, self._remove, self._modify)
+        ])
         
-        if not all_records:
+        if len(confidences) == 0:
             return {'high': 0, 'medium': 0, 'low': 0}
             
-        high = sum(1 for r in all_records if r['confidence'] > 0.85)
-        medium = sum(1 for r in all_records if 0.70 <= r['confidence'] <= 0.85)
-        low = sum(1 for r in all_records if r['confidence'] < 0.70)
+        low, medium, high = (int(c) for c in np.histogram(confidences, bins=CONFIDENCE_BINS)[0])
+        total = len(confidences)
         
         return {
             'high': high,
             'medium': medium,
             'low': low,
-            'high_pct': round(high / len(all_records) * 100, 1),
-            'medium_pct': round(medium / len(all_records) * 100, 1),
-            'low_pct': round(low / len(all_records) * 100, 1)
+            'high_pct': round(high / total * 100, 1),
+            'medium_pct': round(medium / total * 100, 1),
+            'low_pct': round(low / total * 100, 1)
         }
         
     def _calculate_quality_metrics(self) -> Dict:
@@ -438,22 +793,19 @@ class EnhancedSourceAnalyzer:
         if total == 0:
             return {'quality_score': 0, 'issues_found': 0}
             
-        issues = len(self.records_to_remove) + len(self.records_to_modify)
+        issues = len(self._remove) + len(self._modify)
         quality_score = max(0, 100 - (issues / total * 100))
         
         return {
             'quality_score': round(quality_score, 2),
             'issues_found': issues,
-            'removal_rate': round(len(self.records_to_remove) / total * 100, 2),
-            'modification_rate': round(len(self.records_to_modify) / total * 100, 2)
+            'removal_rate': round(len(self._remove) / total * 100, 2),
+            'modification_rate': round(len(self._modify) / total * 100, 2)
         }
         
-    def _track_quality_metrics(self):
-        """Record quality metrics for trend tracking"""
-        summary = self.generate_enhanced_summary()
-        
-        # Prepare data for quality tracker
-        analysis_results = {
+    def _quality_results(self, summary: Dict) -> Dict:
+        """Prepare the summary fields the quality tracker records"""
+        return {
             'total_records': summary['total_records'],
             'kept_records': summary['kept_records'],
             'removed_records': summary['removed_records'],
@@ -465,18 +817,23 @@ class EnhancedSourceAnalyzer:
             'schema_version': summary['schema_version']
         }
         
+    def _track_quality_metrics(self, analysis_results: Optional[Dict] = None):
+        """Record quality metrics for trend tracking"""
+        if analysis_results is None:
+            analysis_results = self._quality_results(self.generate_enhanced_summary())
+        
         self.quality_tracker.record_source_analysis(
             self.source_id, self.source_name, analysis_results
         )
         
     def export_summary(self, summary_data: Dict):
         """Export summary in multiple formats"""
-        output_dir = f"Source Data Cleanup Analysis/Source_{self.source_id}"
+        output_dir = self.output_dir
         
         # JSON export
         json_path = f"{output_dir}/summary.json"
         with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, indent=2)
+            f.write(json.dumps(summary_data, indent=2))
             
         # Markdown export
         md_path = f"{output_dir}/summary.md"
@@ -490,14 +847,14 @@ class EnhancedSourceAnalyzer:
         with open(txt_path, 'w', encoding='utf-8') as f:
             f.write(txt_content)
             
-        print(f"\nExported summaries:")
-        print(f"  JSON: {json_path}")
-        print(f"  Markdown: {md_path}")
-        print(f"  Text: {txt_path}")
+        self._say(f"\nExported summaries:")
+        self._say(f"  JSON: {json_path}")
+        self._say(f"  Markdown: {md_path}")
+        self._say(f"  Text: {txt_path}")
         
     def _generate_markdown_report(self, summary: Dict) -> str:
         """Generate markdown report"""
-        md = f"""# Source {self.source_id} Cleanup Analysis Report
+        parts = [f"""# Source {self.source_id} Cleanup Analysis Report
 
 **File**: {summary['source_name']}  
 **Analyzed**: {summary['timestamp']}  
@@ -528,17 +885,17 @@ class EnhancedSourceAnalyzer:
 
 | Reason | Count |
 |--------|-------|
-"""
+"""]
         
-        for reason, count in list(summary['removal_reasons'].items())[:10]:
-            md += f"| {reason} | {count} |\n"
+        parts.extend(f"| {reason} | {count} |\n"
+                     for reason, count in list(summary['removal_reasons'].items())[:10])
             
         if summary['modification_types']:
-            md += "\n## Modification Types\n\n| Type | Count |\n|------|-------|\n"
-            for mod_type, count in summary['modification_types'].items():
-                md += f"| {mod_type} | {count} |\n"
+            parts.append("\n## Modification Types\n\n| Type | Count |\n|------|-------|\n")
+            parts.extend(f"| {mod_type} | {count} |\n"
+                         for mod_type, count in summary['modification_types'].items())
                 
-        md += f"""
+        parts.append(f"""
 ## Confidence Distribution
 
 - **High (>85%)**: {summary['confidence_distribution']['high']} ({summary['confidence_distribution']['high_pct']}%)
@@ -552,9 +909,9 @@ class EnhancedSourceAnalyzer:
 3. Verify that important metrics are preserved
 4. Check metric reclassifications make economic sense
 5. Approve or modify the cleanup plan before execution
-"""
+""")
         
-        return md
+        return ''.join(parts)
         
     def _generate_text_summary(self, summary: Dict) -> str:
         """Generate traditional text summary for compatibility"""
@@ -577,18 +934,60 @@ Please review the detailed reports before proceeding with cleanup.
 """
 
 
+def _analyze_source(source_id: int, previous_cleaned_file: str, data_sources_file: str):
+    """Worker for run_all: analyze one source, leaving quality tracking and output to the caller"""
+    analyzer = EnhancedSourceAnalyzer(source_id, previous_cleaned_file, data_sources_file)
+    analysis_results = analyzer.analyze(track_quality=False, echo=False)
+    return analyzer.source_name, analysis_results, analyzer.last_output
+
+
+def run_all(source_ids: List[int], previous_cleaned_file: str = 'ai_metrics.csv',
+            data_sources_file: str = 'data/exports/data_sources_20250719.csv',
+            max_workers: Optional[int] = None) -> QualityTracker:
+    """
+    Analyze several sources in parallel, one worker process per source
+    
+    Sources are independent, so each worker streams its own rows from the
+    metrics file. Reports are printed and quality results recorded afterwards
+    in source order, so neither stdout nor the tracking file sees
+    concurrent writes.
+    
+    Args:
+        source_ids: Sources to analyze
+        max_workers: Worker processes (defaults to the CPU count)
+        
+    Returns:
+        The quality tracker holding this run's results
+    """
+    quality_tracker = QualityTracker()
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        results = list(executor.map(_analyze_source, source_ids,
+                                    [previous_cleaned_file] * len(source_ids),
+                                    [data_sources_file] * len(source_ids)))
+        
+    for source_id, (source_name, analysis_results, output) in zip(source_ids, results):
+        sys.stdout.write(output)
+        if analysis_results is not None:
+            quality_tracker.record_source_analysis(source_id, source_name, analysis_results)
+    return quality_tracker
+
+
 if __name__ == "__main__":
     import sys
     
     if len(sys.argv) > 1:
-        source_id = int(sys.argv[1])
+        source_ids = [int(source_id) for source_id in sys.argv[1].split(',')]
         previous_file = sys.argv[2] if len(sys.argv) > 2 else 'ai_metrics.csv'
         
-        analyzer = EnhancedSourceAnalyzer(source_id, previous_file)
-        analyzer.analyze()
+        if len(source_ids) > 1:
+            quality_tracker = run_all(source_ids, previous_file)
+        else:
+            analyzer = EnhancedSourceAnalyzer(source_ids[0], previous_file)
+            analyzer.analyze()
+            quality_tracker = analyzer.quality_tracker
         
         # Show quality trends
-        trends = analyzer.quality_tracker.get_quality_trends()
+        trends = quality_tracker.get_quality_trends()
         if 'error' not in trends:
             print("\n" + "=" * 80)
             print("OVERALL QUALITY TRENDS")
@@ -596,5 +995,6 @@ if __name__ == "__main__":
             print(f"Average Quality Score: {trends['average_quality_score']}%")
             print(f"Total Sources Analyzed: {trends['total_sources_analyzed']}")
     else:
-        print("Usage: python source_cleanup_enhanced.py <source_id> [previous_cleaned_file]")
-        print("Example: python source_cleanup_enhanced.py 8 ai_metrics_cleaned_source1_7.csv")
\ No newline at end of file
+        print("Usage: python source_cleanup_enhanced.py <source_id>[,<source_id>...] [previous_cleaned_file]")
+        print("Example: python source_cleanup_enhanced.py 8 ai_metrics_cleaned_source1_7.csv")
+        print("Example: python source_cleanup_enhanced.py 8,9,10 ai_metrics_cleaned_source1_7.csv")
\ No newline at end of file
@@ -56,9 +56,10 @@ class SourceCleanupAnalyzer:
         # Pre-process to identify duplicate groups
         self.identify_duplicate_groups()
         
-        # Analyze each record
-        for idx, row in self.source_df.iterrows():
-            self.categorize_record(idx, row)
+        # Analyze each record; plain tuples avoid building a Series per row
+        columns = ['value', 'unit', 'year', 'metric_type', 'context']
+        for idx, *fields in self.source_df[columns].itertuples(index=True, name=None):
+            self.categorize_record(idx, dict(zip(columns, fields)))
             
         # Generate reports
         self.generate_csv_reports()
@@ -4,11 +4,30 @@ Handles all validation logic for economic metrics using schema-based rules
 """
 
 import re
+import inspect
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
 from metric_validation_schema import METRIC_VALIDATION_SCHEMA, CROSS_METRIC_RULES, RECLASSIFICATION_PRIORITY
 
 
+# Citation patterns, compiled once and tried as a single alternation
+CITATION_PATTERNS = [
+    r'\(\d{4}\)',  # (2024)
+    r'\b(?:19|20)\d{2}\)',  # Years starting with 19 or 20
+    r'et al\.?\s*\(?(?:19|20)\d{2}',  # et al. 2024 or et al. (2024)
+    r'[A-Z][a-z]+\s+\(?(?:19|20)\d{2}',  # Author (2024)
+    r'[A-Z][a-z]+\s+and\s+[A-Z][a-z]+\s*\(?(?:19|20)\d{2}',  # Author and Author (2024)
+]
+CITATION_REGEX = re.compile('|'.join(f'(?:{pattern})' for pattern in CITATION_PATTERNS))
+
+# Additional keywords that suggest citations
+CITATION_KEYWORDS = ['article', 'paper', 'study', 'research', 'publication',
+                     'journal', 'conference', 'proceedings']
+
+# Context patterns that explain a zero as a change metric
+CHANGE_PATTERNS = ['change', 'increase', 'decrease', 'growth', 'reduction', 'decline']
+
+
 class MetricValidator:
     """Validates economic metrics against defined schemas and rules"""
     
@@ -26,6 +45,7 @@ class MetricValidator:
             r'\binformation.*technology\b',
             r'\bcommunication.*technology\b'
         ]
+        self.ict_regex = re.compile('|'.join(self.ict_patterns), re.IGNORECASE)
         
         # Meaningful zero context patterns
         self.meaningful_zero_patterns = [
@@ -37,10 +57,20 @@ class MetricValidator:
             'analysis found', 'research shows', 'data indicates'
         ]
         
-    def validate_against_schema(self, metric_type: str, value: float, unit: str, context: str) -> List[Dict]:
+        # Parameter names each cross-metric rule condition expects
+        self._rule_params = [
+            list(inspect.signature(rule['condition']).parameters) if 'condition' in rule else []
+            for rule in self.cross_rules
+        ]
+        
+    def validate_against_schema(self, metric_type: str, value: float, unit: str, context: str,
+                                context_lower: Optional[str] = None) -> List[Dict]:
         """
         Validate a record against the schema for its metric type
         
+        Args:
+            context_lower: Lowercased context, if the caller already has it
+            
         Returns:
             List of validation issues found, each with reason and confidence
         """
@@ -51,6 +81,8 @@ class MetricValidator:
             
         schema = self.schema[schema_key]
         issues = []
+        if context_lower is None:
+            context_lower = context.lower()
         
         # Check unit validity
         if unit in schema.get('invalid_units', []):
@@ -79,10 +111,9 @@ class MetricValidator:
         # Check zero values
         if value == 0 and not schema.get('zero_value_valid', True):
             # First check if this is a meaningful zero from a survey/study
-            if not self.is_meaningful_zero(value, context):
+            if not self.is_meaningful_zero(value, context_lower):
                 # Then check if context suggests it's a change metric
-                change_patterns = ['change', 'increase', 'decrease', 'growth', 'reduction', 'decline']
-                if not any(pattern in context.lower() for pattern in change_patterns):
+                if not any(pattern in context_lower for pattern in CHANGE_PATTERNS):
                     issues.append({
                         'reason': f"Zero value suspicious for {metric_type}",
                         'confidence': 0.80,
@@ -91,7 +122,7 @@ class MetricValidator:
                 
         # Check required patterns
         patterns_required = schema.get('patterns_required', [])
-        if patterns_required and not any(pattern in context.lower() for pattern in patterns_required):
+        if patterns_required and not any(pattern in context_lower for pattern in patterns_required):
             issues.append({
                 'reason': f"Context missing required patterns for {metric_type}",
                 'confidence': 0.70,
@@ -100,7 +131,7 @@ class MetricValidator:
             
         # Check excluded patterns
         patterns_exclude = schema.get('patterns_exclude', [])
-        if any(pattern in context.lower() for pattern in patterns_exclude):
+        if any(pattern in context_lower for pattern in patterns_exclude):
             issues.append({
                 'reason': f"Context contains excluded patterns for {metric_type}",
                 'confidence': 0.75,
@@ -119,7 +150,7 @@ class MetricValidator:
         """
         issues = []
         
-        for rule in self.cross_rules:
+        for rule, expected_params in zip(self.cross_rules, self._rule_params):
             try:
                 # Try to apply the rule with available parameters
                 rule_params = {
@@ -130,11 +161,6 @@ class MetricValidator:
                     'context': context
                 }
                 
-                # Get the parameters the rule condition expects
-                import inspect
-                sig = inspect.signature(rule['condition'])
-                expected_params = list(sig.parameters.keys())
-                
                 # Filter to only pass expected parameters
                 filtered_params = {k: v for k, v in rule_params.items() if k in expected_params}
                 
@@ -154,14 +180,18 @@ class MetricValidator:
         return issues
     
     def classify_metric_type(self, context: str, value: float, unit: str, 
-                           current_type: str = None) -> str:
+                           current_type: str = None, context_lower: Optional[str] = None) -> str:
         """
         Classify vague metric types using schema patterns and context
         
+        Args:
+            context_lower: Lowercased context, if the caller already has it
+            
         Returns:
             Classified metric type or 'unknown_metric' if no match
         """
-        context_lower = context.lower()
+        if context_lower is None:
+            context_lower = context.lower()
         
         # Check each metric type in priority order
         for metric_type in self.reclassification_priority:
@@ -200,22 +230,12 @@ class MetricValidator:
         # Check if value equals year and is in reasonable year range
         if value == year and 1900 <= value <= 2030:
             # Look for citation patterns
-            citation_patterns = [
-                r'\(\d{4}\)',  # (2024)
-                r'\b(?:19|20)\d{2}\)',  # Years starting with 19 or 20
-                r'et al\.?\s*\(?(?:19|20)\d{2}',  # et al. 2024 or et al. (2024)
-                r'[A-Z][a-z]+\s+\(?(?:19|20)\d{2}',  # Author (2024)
-                r'[A-Z][a-z]+\s+and\s+[A-Z][a-z]+\s*\(?(?:19|20)\d{2}',  # Author and Author (2024)
-            ]
-            
-            for pattern in citation_patterns:
-                if re.search(pattern, context):
-                    return True
+            if CITATION_REGEX.search(context):
+                return True
                     
             # Additional keywords that suggest citations
-            citation_keywords = ['article', 'paper', 'study', 'research', 'publication', 
-                               'journal', 'conference', 'proceedings']
-            if any(keyword in context.lower() for keyword in citation_keywords):
+            context_lower = context.lower()
+            if any(keyword in context_lower for keyword in CITATION_KEYWORDS):
                 return True
                 
         return False
@@ -302,13 +322,7 @@ class MetricValidator:
         Returns:
             True if ICT-related content detected
         """
-        context_lower = context.lower()
-        
-        for pattern in self.ict_patterns:
-            if re.search(pattern, context_lower, re.IGNORECASE):
-                return True
-                
-        return False
+        return bool(self.ict_regex.search(context))
     
     def is_meaningful_zero(self, value: float, context: str) -> bool:
         """
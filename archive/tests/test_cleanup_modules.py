@@ -315,8 +315,8 @@ class TestEnhancedSourceAnalyzer:
         
         # Process the records
         analyzer.identify_duplicate_groups()
-        for idx, row in analyzer.source_df.iterrows():
-            analyzer.categorize_record(idx, row)
+        for idx in analyzer.source_df.index:
+            analyzer.categorize_record(idx)
             
         # Check that citations were removed
         citation_removals = [r for r in analyzer.records_to_remove 
@@ -330,8 +330,8 @@ class TestEnhancedSourceAnalyzer:
         
         # Process the records
         analyzer.identify_duplicate_groups()
-        for idx, row in analyzer.source_df.iterrows():
-            analyzer.categorize_record(idx, row)
+        for idx in analyzer.source_df.index:
+            analyzer.categorize_record(idx)
             
         # Check that employment metric with financial unit was flagged
         unit_issues = [r for r in analyzer.records_to_remove 
@@ -345,8 +345,8 @@ class TestEnhancedSourceAnalyzer:
         
         # Process the records
         analyzer.identify_duplicate_groups()
-        for idx, row in analyzer.source_df.iterrows():
-            analyzer.categorize_record(idx, row)
+        for idx in analyzer.source_df.index:
+            analyzer.categorize_record(idx)
             
         # Check that general_rate was reclassified
         reclassifications = [r for r in analyzer.records_to_modify 
@@ -372,8 +372,8 @@ class TestEnhancedSourceAnalyzer:
         
         # Run minimal analysis
         analyzer.identify_duplicate_groups()
-        for idx, row in analyzer.source_df.iterrows():
-            analyzer.categorize_record(idx, row)
+        for idx in analyzer.source_df.index:
+            analyzer.categorize_record(idx)
             
         summary = analyzer.generate_enhanced_summary()
         
@@ -405,8 +405,8 @@ class TestEnhancedSourceAnalyzer:
         analyzer = EnhancedSourceAnalyzer(1, temp_file, sources_file)
         
         # Process records
-        for idx, row in analyzer.source_df.iterrows():
-            analyzer.categorize_record(idx, row)
+        for idx in analyzer.source_df.index:
+            analyzer.categorize_record(idx)
             
         # Check that incomplete record was removed
         incomplete_removals = [r for r in analyzer.records_to_remove 
@@ -0,0 +1,79 @@
+"""
+Tests for the incremental JSON array reader of the extraction system
+"""
+
+import io
+import json
+import sys
+from itertools import islice
+from pathlib import Path
+
+import pytest
+
+# The extraction scripts import their sibling modules directly
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src' / 'extraction_system'))
+
+from json_stream import iter_json_array
+
+
+VALID_DOCUMENTS = [
+    '[]',
+    '  [ ]  ',
+    '\n[1]\n',
+    '[1, 2.5, -3e2, 1.5e10, 0]',
+    '[true, false, null, "a, b ] c", "esc\\"aped\\\\"]',
+    '[{"surrounding_text": "AI [adoption], 45%", "nested": {"a": [1, {"b": []}]}}, [], {}]',
+    '[\n  {"decision": "accept"},\n  {"decision": "reject"}\n]\n',
+    '[' + ', '.join(json.dumps({'id': i, 'text': 'x' * (i % 7)}) for i in range(50)) + ']',
+    '["unicode é ✓", 12345678901234567890]',
+]
+
+MALFORMED_DOCUMENTS = [
+    '',
+    '   ',
+    '[',
+    '[1',
+    '[1,',
+    '[1,]',
+    '[,1]',
+    '[1,,2]',
+    '[,]',
+    '[1 2]',
+    '[1]garbage',
+    '[1]]x',
+    '[1] [2]',
+    '[1]\n,',
+    '[{"a": 1]',
+    '["unterminated]',
+]
+
+
+class TestIterJsonArray:
+    """Test iter_json_array against json.loads"""
+    
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 65536])
+    @pytest.mark.parametrize('document', VALID_DOCUMENTS)
+    def test_round_trips_valid_arrays(self, document, chunk_size):
+        """Test that every chunk size yields the items json.loads gives"""
+        items = list(iter_json_array(io.StringIO(document), chunk_size=chunk_size))
+        assert items == json.loads(document)
+    
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 65536])
+    @pytest.mark.parametrize('document', MALFORMED_DOCUMENTS)
+    def test_rejects_what_json_rejects(self, document, chunk_size):
+        """Test that input json.loads refuses raises instead of being read"""
+        with pytest.raises(ValueError):
+            json.loads(document)
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO(document), chunk_size=chunk_size))
+    
+    def test_rejects_other_top_level_values(self):
+        """Test that valid JSON which isn't an array raises"""
+        for document in ['{"a": 1}', '1', '"[1]"']:
+            with pytest.raises(ValueError):
+                list(iter_json_array(io.StringIO(document)))
+    
+    def test_stops_early_without_reading_the_rest(self):
+        """Test that taking the first items doesn't parse the remainder"""
+        document = '[1, 2, 3, this is not json'
+        assert list(islice(iter_json_array(io.StringIO(document), chunk_size=4), 3)) == [1, 2, 3]
@@ -13,7 +13,10 @@ import plotly.graph_objects as go
 import pandas as pd
 
 # Import our data models
-from src.models.schema import create_sample_data, AIAdoptionMetric
+from src.models.schema import create_sample_data, AIAdoptionMetric, MetricType
+
+# Display names for each metric type, e.g. "adoption_rate" -> "Adoption Rate"
+METRIC_LABELS = {t.value: t.value.replace("_", " ").title() for t in MetricType}
 
 # Initialize the Dash app with a nice theme
 # Think of this as setting up your presentation template
@@ -23,6 +26,84 @@ app = dash.Dash(
     title="Economics of AI Dashboard"
 )
 
+
+def create_adoption_figure():
+    """Create adoption trends chart"""
+    # For now, using sample data
+    # Later, this will pull from our database
+    
+    # Create sample trend data
+    years = [2020, 2021, 2022, 2023, 2024]
+    tech_adoption = [25, 32, 38, 45, 52]
+    finance_adoption = [20, 28, 35, 42, 48]
+    manufacturing_adoption = [15, 20, 26, 32, 38]
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scattergl(
+        x=years, y=tech_adoption,
+        mode='lines+markers',
+        name='Technology',
+        line=dict(width=3)
+    ))
+    
+    fig.add_trace(go.Scattergl(
+        x=years, y=finance_adoption,
+        mode='lines+markers', 
+        name='Finance',
+        line=dict(width=3)
+    ))
+    
+    fig.add_trace(go.Scattergl(
+        x=years, y=manufacturing_adoption,
+        mode='lines+markers',
+        name='Manufacturing',
+        line=dict(width=3)
+    ))
+    
+    fig.update_layout(
+        yaxis_title="Adoption Rate (%)",
+        xaxis_title="Year",
+        hovermode='x unified',
+        template="plotly_white"
+    )
+    
+    return fig
+
+
+def create_investment_figure():
+    """Create investment by region chart"""
+    
+    regions = ['North America', 'Europe', 'Asia Pacific', 'Rest of World']
+    investment = [45.2, 32.1, 38.5, 12.0]
+    
+    fig = px.pie(
+        values=investment,
+        names=regions,
+        hole=0.4,  # Makes it a donut chart
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    
+    fig.update_traces(
+        textposition='inside',
+        textinfo='percent+label',
+        hovertemplate='<b>%{label}</b><br>$%{value}B<br>%{percent}<extra></extra>'
+    )
+    
+    fig.update_layout(
+        showlegend=True,
+        template="plotly_white"
+    )
+    
+    return fig
+
+
+# The charts only show fixed sample data, so build them once at startup
+# instead of in callbacks that fire on every page load
+ADOPTION_FIG = create_adoption_figure()
+INVESTMENT_FIG = create_investment_figure()
+
+
 # Create the layout - this is what users will see
 # Think of it as designing the pages of your economic report
 app.layout = dbc.Container([
@@ -87,7 +168,7 @@ app.layout = dbc.Container([
             dbc.Card([
                 dbc.CardHeader("AI Adoption Trends by Sector"),
                 dbc.CardBody([
-                    dcc.Graph(id="adoption-chart")
+                    dcc.Graph(id="adoption-chart", figure=ADOPTION_FIG)
                 ])
             ])
         ], md=6),
@@ -97,7 +178,7 @@ app.layout = dbc.Container([
             dbc.Card([
                 dbc.CardHeader("AI Investment by Region"),
                 dbc.CardBody([
-                    dcc.Graph(id="investment-chart")
+                    dcc.Graph(id="investment-chart", figure=INVESTMENT_FIG)
                 ])
             ])
         ], md=6),
@@ -121,85 +202,6 @@ app.layout = dbc.Container([
 # Callbacks - These make the dashboard interactive
 # Think of callbacks as "when user does X, update Y"
 
-@callback(
-    Output("adoption-chart", "figure"),
-    Input("adoption-chart", "id")  # Triggered on load
-)
-def update_adoption_chart(_):
-    """Create adoption trends chart"""
-    # For now, using sample data
-    # Later, this will pull from our database
-    
-    # Create sample trend data
-    years = [2020, 2021, 2022, 2023, 2024]
-    tech_adoption = [25, 32, 38, 45, 52]
-    finance_adoption = [20, 28, 35, 42, 48]
-    manufacturing_adoption = [15, 20, 26, 32, 38]
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=years, y=tech_adoption,
-        mode='lines+markers',
-        name='Technology',
-        line=dict(width=3)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=years, y=finance_adoption,
-        mode='lines+markers', 
-        name='Finance',
-        line=dict(width=3)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=years, y=manufacturing_adoption,
-        mode='lines+markers',
-        name='Manufacturing',
-        line=dict(width=3)
-    ))
-    
-    fig.update_layout(
-        yaxis_title="Adoption Rate (%)",
-        xaxis_title="Year",
-        hovermode='x unified',
-        template="plotly_white"
-    )
-    
-    return fig
-
-
-@callback(
-    Output("investment-chart", "figure"),
-    Input("investment-chart", "id")
-)
-def update_investment_chart(_):
-    """Create investment by region chart"""
-    
-    regions = ['North America', 'Europe', 'Asia Pacific', 'Rest of World']
-    investment = [45.2, 32.1, 38.5, 12.0]
-    
-    fig = px.pie(
-        values=investment,
-        names=regions,
-        hole=0.4,  # Makes it a donut chart
-        color_discrete_sequence=px.colors.qualitative.Set3
-    )
-    
-    fig.update_traces(
-        textposition='inside',
-        textinfo='percent+label',
-        hovertemplate='<b>%{label}</b><br>$%{value}B<br>%{percent}<extra></extra>'
-    )
-    
-    fig.update_layout(
-        showlegend=True,
-        template="plotly_white"
-    )
-    
-    return fig
-
-
 @callback(
     Output("data-table", "children"),
     Input("data-table", "id")
@@ -208,22 +210,19 @@ def update_data_table(_):
     """Create a simple data table from our sample data"""
     
     # Get sample data
-    metrics = create_sample_data()
+    metrics = pd.DataFrame(create_sample_data())
     
-    # Convert to a simple HTML table
+    # Format each column in one pass, then turn the rows into a simple HTML table
     # In a real app, we'd use dash_table.DataTable for more features
-    
-    rows = []
-    for metric in metrics:
-        rows.append(
-            html.Tr([
-                html.Td(str(metric.year)),
-                html.Td(metric.sector or "Global"),
-                html.Td(metric.metric_type.replace("_", " ").title()),
-                html.Td(f"{metric.value:.1f} {metric.unit}"),
-                html.Td(metric.source.value if metric.source else "Unknown")
-            ])
-        )
+    cells = pd.DataFrame({
+        'year': metrics['year'].astype(str),
+        'sector': metrics['sector'].fillna("").replace("", "Global"),
+        'metric': metrics['metric_type'].map(METRIC_LABELS),
+        'value': metrics['value'].map("{:.1f}".format) + " " + metrics['unit'],
+        'source': metrics['source'].map(lambda source: source.value if source else "Unknown")
+    })
+    
+    rows = [html.Tr([html.Td(cell) for cell in row]) for row in cells.itertuples(index=False)]
     
     table = dbc.Table([
         html.Thead([
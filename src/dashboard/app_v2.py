@@ -6,13 +6,17 @@ from authoritative AI economics reports.
 """
 
 import dash
-from dash import dcc, html, callback, Input, Output, State
+from dash import dcc, html, callback, Input, Output, State, Patch
 import dash_bootstrap_components as dbc
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+import heapq
+from importlib.util import find_spec
+import os
 import sys
+import time
 from pathlib import Path
 
 # Add project root to path
@@ -20,22 +24,79 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.database.operations import MetricsDatabase
-from src.dashboard.pages.investment import create_investment_layout, set_db_instance
+from src.dashboard.pages.investment import create_investment_layout, register_investment_callbacks
 
 # Initialize database connection
 db = MetricsDatabase()
 
-# Set database instance for investment page callbacks
-set_db_instance(db)
+# Seconds a cached lookup or page is served before it is rebuilt from the
+# database, so newly loaded data shows up without restarting the app
+CACHE_TIMEOUT = 300
 
-# Initialize the Dash app
+def ttl_cache(maxsize=128, timeout=CACHE_TIMEOUT):
+    """
+    lru_cache whose entries expire after about timeout seconds.
+    
+    The current timeout period is part of the cache key, so a call in a
+    new period misses and the stale entries age out of the LRU.
+    """
+    def decorator(func):
+        cached = lru_cache(maxsize=maxsize)(
+            lambda period, *args, **kwargs: func(*args, **kwargs)
+        )
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return cached(int(time.monotonic() // timeout), *args, **kwargs)
+        
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
+
+# Cached database lookups. The dashboard only reads, so repeat visits and
+# callbacks within CACHE_TIMEOUT are answered from memory instead of
+# re-querying SQLite.
+@ttl_cache(maxsize=256)
+def get_latest_value(indicator, country):
+    """Cached db.get_latest_value."""
+    return db.get_latest_value(indicator, country)
+
+@ttl_cache(maxsize=256)
+def get_metrics_by_type(metric_type, year=None):
+    """Cached db.get_metrics_by_type; callers must not modify the result."""
+    return db.get_metrics_by_type(metric_type, year=year)
+
+@ttl_cache(maxsize=256)
+def get_time_series_multi(indicator, countries, year_min, year_max):
+    """Cached db.get_time_series_multi; callers must not modify the result."""
+    return db.get_time_series_multi(indicator, list(countries), year_min, year_max)
+
+# Most points sent to the browser per time-series trace
+MAX_POINTS_PER_TRACE = 1000
+
+def downsample(df, max_points=MAX_POINTS_PER_TRACE):
+    """Keep every n-th row so a trace has at most max_points points."""
+    step = -(-len(df) // max_points)
+    return df.iloc[::step] if step > 1 else df
+
+# Initialize the Dash app. Responses (mostly figure JSON) are gzipped
+# when the optional flask-compress package is installed
 app = dash.Dash(
     __name__,
     external_stylesheets=[dbc.themes.BOOTSTRAP],
     title="Economics of AI Dashboard - Real Data Edition",
-    suppress_callback_exceptions=True
+    suppress_callback_exceptions=True,
+    compress=find_spec("flask_compress") is not None
 )
 
+# Investment page callbacks, reading from our database
+register_investment_callbacks(app, db)
+
+# WSGI entry point for production, served by multiple workers/threads so
+# callbacks waiting on the database don't block each other, e.g.
+#   gunicorn -k gthread -w 4 --threads 4 src.dashboard.app_v2:server
+server = app.server
+
 # Create navigation bar
 navbar = dbc.NavbarSimple(
     children=[
@@ -52,8 +113,36 @@ navbar = dbc.NavbarSimple(
     className="mb-4"
 )
 
-# Get summary statistics for the overview
-summary_stats = db.get_summary_stats()
+@dataclass(slots=True, frozen=True)
+class SummaryStats:
+    """Immutable snapshot of the database summary shown on the overview."""
+    total_metrics: int
+    unique_indicators: int
+    unique_countries: int
+    year_range: tuple
+    avg_confidence: float
+    metrics_by_type: dict
+    metric_labels: dict
+    
+    @classmethod
+    def from_db(cls, stats):
+        """Build from the dictionary returned by db.get_summary_stats()."""
+        return cls(
+            total_metrics=stats['total_metrics'],
+            unique_indicators=stats['metric_types'],
+            unique_countries=stats['regions'],
+            year_range=tuple(stats['year_range']),
+            avg_confidence=stats['avg_confidence'] or 0.0,
+            metrics_by_type=stats['metrics_by_type'],
+            # Display names for the known metric types, worked out once
+            metric_labels={t: t.replace('_', ' ').title() for t in stats['metrics_by_type']}
+        )
+
+# Summary statistics for the overview, read on first use instead of at import
+@ttl_cache(maxsize=1)
+def get_summary_stats():
+    """Cached SummaryStats for the whole database."""
+    return SummaryStats.from_db(db.get_summary_stats())
 
 # Main layout with URL routing
 app.layout = html.Div([
@@ -62,14 +151,22 @@ app.layout = html.Div([
     html.Div(id='page-content')
 ])
 
-# Overview page layout
+# Overview page layout, rebuilt at most once per CACHE_TIMEOUT
+@ttl_cache(maxsize=1)
 def create_overview_layout():
     """Create the main overview page."""
     
-    # Get latest metrics for key indicators
-    latest_adoption = db.get_latest_value('adoption_rate', 'United States')
-    latest_investment = db.get_latest_value('ai_investment', 'Global')
-    latest_productivity = db.get_latest_value('productivity', 'Global')
+    summary_stats = get_summary_stats()
+    
+    # Get latest metrics for key indicators. The three lookups are
+    # independent reads, so run them side by side
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        adoption = executor.submit(get_latest_value, 'adoption_rate', 'United States')
+        investment = executor.submit(get_latest_value, 'ai_investment', 'Global')
+        productivity = executor.submit(get_latest_value, 'productivity', 'Global')
+    latest_adoption = adoption.result()
+    latest_investment = investment.result()
+    latest_productivity = productivity.result()
     
     return dbc.Container([
         # Header
@@ -77,7 +174,7 @@ def create_overview_layout():
             dbc.Col([
                 html.H1("AI Economics Dashboard", className="text-center mb-4"),
                 html.P(
-                    f"Analyzing {summary_stats['total_metrics']:,} economic metrics from {summary_stats['unique_indicators']} indicators",
+                    f"Analyzing {summary_stats.total_metrics:,} economic metrics from {summary_stats.unique_indicators} indicators",
                     className="text-center text-muted lead"
                 )
             ])
@@ -105,8 +202,8 @@ def create_overview_layout():
                 dbc.Card([
                     dbc.CardBody([
                         html.H4("Total Metrics", className="card-title"),
-                        html.H2(f"{summary_stats['total_metrics']:,}", className="text-success"),
-                        html.P(f"From {summary_stats['unique_countries']} countries", className="text-muted")
+                        html.H2(f"{summary_stats.total_metrics:,}", className="text-success"),
+                        html.P(f"From {summary_stats.unique_countries} countries", className="text-muted")
                     ])
                 ])
             ], md=3),
@@ -116,7 +213,7 @@ def create_overview_layout():
                     dbc.CardBody([
                         html.H4("Year Range", className="card-title"),
                         html.H2(
-                            f"{summary_stats['year_range'][0]}-{summary_stats['year_range'][1]}",
+                            f"{summary_stats.year_range[0]}-{summary_stats.year_range[1]}",
                             className="text-info"
                         ),
                         html.P("Data coverage", className="text-muted")
@@ -128,7 +225,7 @@ def create_overview_layout():
                 dbc.Card([
                     dbc.CardBody([
                         html.H4("Confidence", className="card-title"),
-                        html.H2(f"{summary_stats['avg_confidence']:.0%}", className="text-warning"),
+                        html.H2(f"{summary_stats.avg_confidence:.0%}", className="text-warning"),
                         html.P("Average data confidence", className="text-muted")
                     ])
                 ])
@@ -141,7 +238,7 @@ def create_overview_layout():
                 dbc.Card([
                     dbc.CardHeader("Metrics by Type"),
                     dbc.CardBody([
-                        dcc.Graph(id="metrics-by-type-chart")
+                        dcc.Graph(id="metrics-by-type-chart", figure=create_metrics_by_type_figure())
                     ])
                 ])
             ], md=6),
@@ -150,7 +247,7 @@ def create_overview_layout():
                 dbc.Card([
                     dbc.CardHeader("Top Economic Indicators"),
                     dbc.CardBody([
-                        dcc.Graph(id="top-indicators-chart")
+                        dcc.Graph(id="top-indicators-chart", figure=create_top_indicators_figure())
                     ])
                 ])
             ], md=6),
@@ -162,16 +259,38 @@ def create_overview_layout():
                 dbc.Card([
                     dbc.CardHeader("Recent High-Confidence Metrics"),
                     dbc.CardBody([
-                        html.Div(id="recent-metrics-table")
+                        html.Div(create_recent_metrics_table(), id="recent-metrics-table")
                     ])
                 ])
             ])
         ])
     ], fluid=True)
 
-# AI Adoption page
+# Adoption page selector choices
+YEAR_MARKS = {i: str(i) for i in range(2020, 2026)}
+COUNTRY_OPTIONS = [{'label': c, 'value': c} for c in ('United States', 'China', 'Germany', 'Global')]
+
+# AI Adoption page, fully static so it is built once
+@lru_cache(maxsize=1)
 def create_adoption_layout():
     """Create the AI adoption analysis page."""
+    import plotly.graph_objects as go
+    
+    # Starting trends chart. The callback only patches in the traces, so
+    # the layout and template are built and sent once
+    trends_figure = go.Figure(layout=dict(
+        title="AI Adoption Rate Over Time",
+        xaxis_title="Year",
+        yaxis_title="Adoption Rate (%)",
+        hovermode='x unified',
+        template="plotly_white",
+        legend=dict(
+            yanchor="top",
+            y=0.99,
+            xanchor="left",
+            x=0.01
+        )
+    ))
     
     return dbc.Container([
         html.H2("AI Adoption Analysis", className="mb-4"),
@@ -185,7 +304,7 @@ def create_adoption_layout():
                     min=2020,
                     max=2025,
                     value=[2022, 2024],
-                    marks={i: str(i) for i in range(2020, 2026)},
+                    marks=YEAR_MARKS,
                     step=1
                 )
             ], md=6),
@@ -194,12 +313,7 @@ def create_adoption_layout():
                 html.Label("Select Countries:"),
                 dcc.Dropdown(
                     id='adoption-country-dropdown',
-                    options=[
-                        {'label': 'United States', 'value': 'United States'},
-                        {'label': 'China', 'value': 'China'},
-                        {'label': 'Germany', 'value': 'Germany'},
-                        {'label': 'Global', 'value': 'Global'}
-                    ],
+                    options=COUNTRY_OPTIONS,
                     value=['United States', 'Global'],
                     multi=True
                 )
@@ -212,58 +326,60 @@ def create_adoption_layout():
                 dbc.Card([
                     dbc.CardHeader("Adoption Rate Trends"),
                     dbc.CardBody([
-                        dcc.Graph(id="adoption-trends-chart")
+                        dcc.Graph(id="adoption-trends-chart", figure=trends_figure)
                     ])
                 ])
             ], md=12)
         ])
     ], fluid=True)
 
-# Callbacks for overview page
-@callback(
-    Output("metrics-by-type-chart", "figure"),
-    Input("url", "pathname")
-)
-def update_metrics_by_type(_):
+# Overview page content. It only depends on data that is fixed while the
+# app runs, so it is rendered into the cached layout instead of being
+# filled in by callbacks on every visit.
+def create_metrics_by_type_figure():
     """Create bar chart of metrics by type."""
+    import plotly.express as px
+    import plotly.graph_objects as go
     
     # Get metric type counts from summary
-    metric_types = summary_stats.get('metrics_by_type', {})
+    metric_types = get_summary_stats().metrics_by_type
     
     # Sort by count and take top 10
-    sorted_types = sorted(metric_types.items(), key=lambda x: x[1], reverse=True)[:10]
+    sorted_types = heapq.nlargest(10, metric_types.items(), key=lambda x: x[1])
     
-    df = pd.DataFrame(sorted_types, columns=['Metric Type', 'Count'])
+    types = [t[0] for t in sorted_types]
+    counts = [t[1] for t in sorted_types]
     
-    fig = px.bar(
-        df, 
-        x='Count', 
-        y='Metric Type',
+    # A plain Bar trace; bars are colored by count on a shared color axis
+    fig = go.Figure(go.Bar(
+        x=counts,
+        y=types,
         orientation='h',
-        color='Count',
-        color_continuous_scale='Blues'
-    )
+        marker={'color': counts, 'coloraxis': 'coloraxis'},
+        hovertemplate='Count=%{x}<br>Metric Type=%{y}<extra></extra>'
+    ))
     
     fig.update_layout(
         showlegend=False,
         template="plotly_white",
-        yaxis={'categoryorder': 'total ascending'}
+        xaxis={'title': 'Count'},
+        yaxis={'title': 'Metric Type', 'categoryorder': 'total ascending'},
+        coloraxis={'colorscale': px.colors.sequential.Blues, 'colorbar': {'title': 'Count'}},
+        margin={'t': 60}
     )
     
     return fig
 
-@callback(
-    Output("top-indicators-chart", "figure"),
-    Input("url", "pathname")
-)
-def update_top_indicators(_):
+def create_top_indicators_figure():
     """Create pie chart of top economic indicators."""
+    import plotly.express as px
     
     # Get top 5 metric types
-    metric_types = summary_stats.get('metrics_by_type', {})
-    sorted_types = sorted(metric_types.items(), key=lambda x: x[1], reverse=True)[:5]
+    summary_stats = get_summary_stats()
+    metric_types = summary_stats.metrics_by_type
+    sorted_types = heapq.nlargest(5, metric_types.items(), key=lambda x: x[1])
     
-    labels = [t[0].replace('_', ' ').title() for t in sorted_types]
+    labels = [summary_stats.metric_labels[t[0]] for t in sorted_types]
     values = [t[1] for t in sorted_types]
     
     fig = px.pie(
@@ -285,30 +401,27 @@ def update_top_indicators(_):
     
     return fig
 
-@callback(
-    Output("recent-metrics-table", "children"),
-    Input("url", "pathname")
-)
-def update_recent_metrics_table(_):
+def create_recent_metrics_table():
     """Create table of recent high-confidence metrics."""
+    import pandas as pd
     
     # Get recent high-confidence metrics
-    recent_metrics = db.get_metrics_by_type('adoption_rate', year=2024)[:10]
+    recent_metrics = get_metrics_by_type('adoption_rate', year=2024)[:10]
     
     if not recent_metrics:
         return html.P("No recent metrics found", className="text-muted")
     
-    rows = []
-    for metric in recent_metrics:
-        rows.append(
-            html.Tr([
-                html.Td(str(metric['year'])),
-                html.Td(metric.get('country', 'Global')),
-                html.Td(metric['source']),
-                html.Td(f"{metric['value']:.1f} {metric['unit']}"),
-                html.Td(f"{metric['confidence']:.0%}")
-            ])
-        )
+    # Format each column in one pass, then build the rows from plain tuples
+    metrics = pd.DataFrame(recent_metrics)
+    cells = pd.DataFrame({
+        'year': metrics['year'].astype(str),
+        'country': metrics.get('country', 'Global'),
+        'source': metrics['source'],
+        'value': metrics['value'].map('{:.1f}'.format) + ' ' + metrics['unit'],
+        'confidence': metrics['confidence'].map('{:.0%}'.format)
+    })
+    
+    rows = [html.Tr([html.Td(cell) for cell in row]) for row in cells.itertuples(index=False)]
     
     table = dbc.Table([
         html.Thead([
@@ -333,21 +446,23 @@ def update_recent_metrics_table(_):
 )
 def update_adoption_trends(year_range, countries):
     """Update adoption trends chart based on selections."""
+    import plotly.graph_objects as go
     
     if not countries:
         countries = ['United States']
     
-    fig = go.Figure()
+    traces = []
+    
+    # One query for all selected countries, already limited to the year range
+    data = get_time_series_multi('adoption_rate', tuple(countries), year_range[0], year_range[1])
+    series = dict(tuple(data.groupby('region')))
     
     for country in countries:
-        # Get time series data
-        df = db.get_time_series('adoption_rate', country)
+        df = series.get(country)
         
-        if not df.empty:
-            # Filter by year range
-            df = df[(df['year'] >= year_range[0]) & (df['year'] <= year_range[1])]
-            
-            fig.add_trace(go.Scatter(
+        if df is not None:
+            df = downsample(df)
+            traces.append(go.Scattergl(
                 x=df['year'],
                 y=df['value'],
                 mode='lines+markers',
@@ -355,21 +470,28 @@ def update_adoption_trends(year_range, countries):
                 line=dict(width=3)
             ))
     
-    fig.update_layout(
-        title="AI Adoption Rate Over Time",
-        xaxis_title="Year",
-        yaxis_title="Adoption Rate (%)",
-        hovermode='x unified',
-        template="plotly_white",
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="left",
-            x=0.01
-        )
-    )
-    
-    return fig
+    patched = Patch()
+    patched['data'] = traces
+    return patched
+
+# Placeholder pages, built once
+SECTORS_LAYOUT = html.Div([
+    html.H2("Sector Analysis - Coming Soon"),
+    html.P("This page will show sector-specific AI metrics.")
+])
+
+SOURCES_LAYOUT = html.Div([
+    html.H2("Data Sources - Coming Soon"),
+    html.P("This page will show information about our data sources.")
+])
+
+# Page builders by URL; any other path shows the overview
+PAGES = {
+    '/adoption': create_adoption_layout,
+    '/investment': lambda: create_investment_layout(db),
+    '/sectors': lambda: SECTORS_LAYOUT,
+    '/sources': lambda: SOURCES_LAYOUT,
+}
 
 # Page routing callback
 @callback(
@@ -378,24 +500,8 @@ def update_adoption_trends(year_range, countries):
 )
 def display_page(pathname):
     """Route to different pages based on URL."""
-    
-    if pathname == '/adoption':
-        return create_adoption_layout()
-    elif pathname == '/investment':
-        return create_investment_layout(db)
-    elif pathname == '/sectors':
-        return html.Div([
-            html.H2("Sector Analysis - Coming Soon"),
-            html.P("This page will show sector-specific AI metrics.")
-        ])
-    elif pathname == '/sources':
-        return html.Div([
-            html.H2("Data Sources - Coming Soon"),
-            html.P("This page will show information about our data sources.")
-        ])
-    else:
-        return create_overview_layout()
+    return PAGES.get(pathname, create_overview_layout)()
 
-# Run the app
+# Run the development server (set DEV=1 for debug mode)
 if __name__ == "__main__":
-    app.run_server(debug=True, host="127.0.0.1", port=8050)
\ No newline at end of file
+    app.run_server(debug=os.environ.get("DEV") == "1", host="127.0.0.1", port=8050, threaded=True)
\ No newline at end of file
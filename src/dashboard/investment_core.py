@@ -0,0 +1,520 @@
+"""
+Investment Analysis - Shared Core
+
+Data loading, statistics, figures, layout and callbacks behind both the
+investment page of the main dashboard and the standalone investment
+dashboard. The expensive work (the investment DataFrame, the summary
+statistics and the SQL aggregates) is cached per database, so it happens
+once however many views are built on it.
+"""
+
+from dash import dcc, html, Input, Output, Patch, dash_table
+import dash_bootstrap_components as dbc
+import plotly.express as px
+import plotly.graph_objects as go
+import numpy as np
+import re
+from functools import lru_cache
+
+
+# Metric types combined for the 'all' selection
+INVESTMENT_TYPES = ('investment', 'ai_investment', 'dollar_amounts')
+
+
+# Publishers that source names are shortened to, in order of precedence
+SOURCE_PUBLISHERS = {
+    'stanford': 'Stanford HAI',
+    'mckinsey': 'McKinsey',
+    'oecd': 'OECD',
+    'goldman': 'Goldman Sachs'
+}
+
+# One alternative per publisher, each scanning the whole name, so the
+# earlier publisher wins when a name mentions several
+SOURCE_PUBLISHER_PATTERN = re.compile(
+    '^(?:' + '|'.join(f'.*?({key})' for key in SOURCE_PUBLISHERS) + ')',
+    re.DOTALL
+)
+
+
+def clean_source_names(sources, trim_pdf_names=False):
+    """
+    Map report file names to short publisher names where we recognize them.
+    
+    With trim_pdf_names, other PDF file names are shortened too.
+    """
+    sources = sources.fillna('Unknown')
+    found = sources.str.lower().str.extract(SOURCE_PUBLISHER_PATTERN).bfill(axis=1).iloc[:, 0]
+    if trim_pdf_names:
+        pdf_names = sources.str.replace('.pdf', '', regex=False).str.replace('_', ' ', regex=False).str[:20] + '...'
+        sources = pdf_names.where(sources.str.contains('.pdf', regex=False), sources)
+    return found.map(SOURCE_PUBLISHERS).fillna(sources)
+
+
+@lru_cache(maxsize=None)
+def compute_dataframe(db):
+    """
+    All investment metrics as one DataFrame, built once per database.
+    
+    Values are also normalized to billions USD in value_billions, and
+    is_money marks the dollar amounts. Callers must not modify the frame.
+    """
+    df = db.get_metrics_df(INVESTMENT_TYPES)
+    unit = df['unit'].to_numpy()
+    value = df['value'].to_numpy(dtype=np.float64)
+    df['value_billions'] = np.where(unit == 'millions_usd', value / 1000, value)
+    df['is_money'] = np.isin(unit, ['millions_usd', 'billions_usd'])
+    
+    # Filter columns as compact types: the text ones repeat a handful of
+    # values, so categories let isin and == compare small integer codes.
+    # Ids and confidences are downcast too; values stay float64 so the
+    # totals and the trend fit keep full precision
+    return df.astype({
+        'unit': 'category',
+        'metric_type': 'category',
+        'sector': 'category',
+        'region': 'category',
+        'year': 'int16',
+        'id': 'int32',
+        'confidence': 'float32'
+    })
+
+
+@lru_cache(maxsize=None)
+def compute_stats(db):
+    """Headline statistics of the investment metrics, computed once per database."""
+    df = compute_dataframe(db)
+    
+    # Array masks over the investment frame
+    money = df['is_money'].to_numpy()
+    years = df['year'].to_numpy()
+    values = df['value'].to_numpy(dtype=np.float64)
+    if len(df):
+        # Total investment (convert to billions)
+        total_investment = float(df['value_billions'].to_numpy()[money].sum())
+        
+        # Get latest year data
+        latest_year = int(years[years <= 2025].max())
+        latest_count = int((years == latest_year).sum())
+        
+        # Count unique sources
+        unique_sources = df['source'].fillna('Unknown').nunique()
+    else:
+        total_investment = 0
+        latest_year = 2024
+        latest_count = 0
+        unique_sources = 0
+    
+    # Calculate YoY growth if we have data
+    yoy_growth = "N/A"
+    if latest_year > 2020:
+        current_year_total = values[money & (years == latest_year)].sum()
+        previous_year_total = values[money & (years == latest_year - 1)].sum()
+        if previous_year_total > 0:
+            yoy_growth = f"{((current_year_total - previous_year_total) / previous_year_total * 100):.1f}%"
+    
+    return {
+        'metric_count': len(df),
+        'total_investment': total_investment,
+        'latest_year': latest_year,
+        'latest_count': latest_count,
+        'unique_sources': unique_sources,
+        'yoy_growth': yoy_growth
+    }
+
+
+# The charts only need per-year and per-source totals, so those are
+# aggregated in SQLite and cached per year range
+@lru_cache(maxsize=256)
+def get_yearly_sums(db, metric_types, year_min, year_max):
+    """Cached db.get_yearly_sums; callers must not modify the result."""
+    return db.get_yearly_sums(metric_types, year_min, year_max)
+
+
+@lru_cache(maxsize=256)
+def get_source_counts(db, metric_types, year_min, year_max):
+    """Cached db.get_source_counts; callers must not modify the result."""
+    return db.get_source_counts(metric_types, year_min, year_max)
+
+
+# Columns of the raw investment data table; the detailed view adds confidence
+TABLE_COLUMNS = [
+    {'name': 'Year', 'id': 'year'},
+    {'name': 'Source', 'id': 'source'},
+    {'name': 'Region', 'id': 'region'},
+    {'name': 'Value', 'id': 'value'},
+    {'name': 'Context', 'id': 'context'}
+]
+
+DETAILED_TABLE_COLUMNS = TABLE_COLUMNS[:4] + [
+    {'name': 'Confidence', 'id': 'confidence'},
+    TABLE_COLUMNS[4]
+]
+
+
+# Starting figures for the two charts. The callbacks send back Patch
+# updates of just the traces and title, so the layout and template are
+# only sent with the page
+TIME_SERIES_FIGURE = go.Figure(layout=dict(
+    xaxis_title="Year",
+    yaxis_title="Investment (Billions USD)",
+    hovermode='x unified',
+    template="plotly_white",
+    showlegend=True
+))
+
+SOURCE_FIGURE = px.pie(
+    values=[],
+    names=[],
+    hole=0.4,
+    color_discrete_sequence=px.colors.qualitative.Set3
+).update_traces(
+    textposition='inside',
+    textinfo='percent+label',
+    hovertemplate='<b>%{label}</b><br>%{value} metrics<br>%{percent}<extra></extra>'
+).update_layout(
+    showlegend=True,
+    template="plotly_white"
+)
+
+
+def no_data_patch(message):
+    """Patch that replaces a chart's title with a centered message; callers clear the traces."""
+    patched = Patch()
+    patched['layout']['title'] = None
+    patched['layout']['annotations'] = [dict(
+        text=message,
+        xref="paper", yref="paper",
+        x=0.5, y=0.5, showarrow=False
+    )]
+    return patched
+
+
+def build_layout(db, detailed=False):
+    """
+    Create the investment analysis view with REAL data.
+    
+    The detailed view is the standalone debugging one: it adds a database
+    status panel and labels the table as the top 20.
+    """
+    stats = compute_stats(db)
+    metric_count = stats['metric_count']
+    total_investment = stats['total_investment']
+    latest_year = stats['latest_year']
+    
+    if detailed:
+        title = html.H1("AI Investment Analysis - Standalone View", className="mb-4")
+    else:
+        title = html.H2("AI Investment Analysis", className="mb-4")
+    
+    status = []
+    if detailed:
+        status.append(dbc.Alert([
+            html.H5("Database Connection Status:", className="alert-heading"),
+            html.P(f"✓ Connected to: data/processed/economics_ai.db"),
+            html.P(f"✓ Total metrics in database: {db.get_summary_stats()['total_metrics']:,}"),
+            html.P(f"✓ Investment-related metrics found: {metric_count}")
+        ], color="info", className="mb-4"))
+    
+    return dbc.Container([
+        # Header
+        dbc.Row([
+            dbc.Col([
+                title,
+                html.P(
+                    f"Analyzing {metric_count} investment data points from {stats['unique_sources']} sources",
+                    className="lead text-muted"
+                )
+            ])
+        ]),
+        
+        # Debug info
+        *status,
+        
+        # Key Investment Metrics - REAL DATA
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H4("Total Investment Found", className="card-title"),
+                        html.H2(
+                            f"${total_investment:.1f}B" if total_investment > 0 else "No Data",
+                            className="text-primary"
+                        ),
+                        html.P(f"From {metric_count} metrics", className="text-muted")
+                    ])
+                ])
+            ], md=3),
+            
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H4("YoY Growth", className="card-title"),
+                        html.H2(stats['yoy_growth'], className="text-success"),
+                        html.P(f"{latest_year-1}-{latest_year}", className="text-muted")
+                    ])
+                ])
+            ], md=3),
+            
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H4("Data Points", className="card-title"),
+                        html.H2(str(metric_count), className="text-info"),
+                        html.P("Investment metrics", className="text-muted")
+                    ])
+                ])
+            ], md=3),
+            
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H4("Latest Year", className="card-title"),
+                        html.H2(str(latest_year), className="text-warning"),
+                        html.P(f"{stats['latest_count']} metrics", className="text-muted")
+                    ])
+                ])
+            ], md=3),
+        ], className="mb-4"),
+        
+        # Controls
+        dbc.Row([
+            dbc.Col([
+                html.Label("Select Metric Type:"),
+                dcc.Dropdown(
+                    id='investment-type-dropdown',
+                    options=[
+                        {'label': 'All Investment Metrics', 'value': 'all'},
+                        {'label': 'AI Investment', 'value': 'ai_investment'},
+                        {'label': 'General Investment', 'value': 'investment'},
+                        {'label': 'Dollar Amounts', 'value': 'dollar_amounts'}
+                    ],
+                    value='all'
+                )
+            ], md=4),
+            
+            dbc.Col([
+                html.Label("Time Period:"),
+                dcc.RangeSlider(
+                    id='investment-year-slider',
+                    min=2010,
+                    max=2025,
+                    value=[2020, 2025],
+                    marks={i: str(i) for i in range(2010, 2026, 2)},
+                    step=1
+                )
+            ], md=8)
+        ], className="mb-4"),
+        
+        # Charts
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Investment Trends Over Time (Real Data)"),
+                    dbc.CardBody([
+                        dcc.Graph(id="investment-time-series", figure=TIME_SERIES_FIGURE)
+                    ])
+                ])
+            ], md=8),
+            
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Data Sources Distribution"),
+                    dbc.CardBody([
+                        dcc.Graph(id="investment-by-source", figure=SOURCE_FIGURE)
+                    ])
+                ])
+            ], md=4)
+        ], className="mb-4"),
+        
+        # Data Table
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader("Raw Investment Data (Top 20)" if detailed else "Raw Investment Data"),
+                    dbc.CardBody([
+                        html.Div(id="investment-data-table")
+                    ])
+                ])
+            ])
+        ])
+    ], fluid=True)
+
+
+def build_validation_layout():
+    """
+    The components the callbacks use, without any data.
+    
+    Dash validates callbacks against this instead of calling a layout
+    function when it is assigned, so a lazily built layout stays lazy.
+    """
+    return html.Div([
+        dcc.Dropdown(id='investment-type-dropdown'),
+        dcc.RangeSlider(id='investment-year-slider', min=2010, max=2025),
+        dcc.Graph(id="investment-time-series"),
+        dcc.Graph(id="investment-by-source"),
+        html.Div(id="investment-data-table")
+    ])
+
+
+def update_investment_time_series(db, metric_type, year_range):
+    """Update investment time series chart with REAL DATA."""
+    
+    # Yearly totals in billions USD of the selected investment metrics
+    metric_types = INVESTMENT_TYPES if metric_type == 'all' else (metric_type,)
+    yearly_data = get_yearly_sums(db, metric_types, year_range[0], year_range[1])
+    
+    if yearly_data.empty:
+        patched = no_data_patch("No investment data found for selected criteria")
+        patched['data'] = []
+        return patched
+    
+    # Main line
+    traces = [go.Scatter(
+        x=yearly_data['year'],
+        y=yearly_data['sum'],
+        mode='lines+markers',
+        name='Total Investment',
+        line=dict(width=3, color='#1f77b4'),
+        marker=dict(size=8),
+        text=[f"{count} data points" for count in yearly_data['count']],
+        hovertemplate='Year: %{x}<br>Investment: $%{y:.1f}B<br>%{text}<extra></extra>'
+    )]
+    
+    # Add trend line if we have enough data
+    if len(yearly_data) > 2:
+        z = np.polyfit(yearly_data['year'], yearly_data['sum'], 1)
+        p = np.poly1d(z)
+        traces.append(go.Scatter(
+            x=yearly_data['year'],
+            y=p(yearly_data['year']),
+            mode='lines',
+            name='Trend',
+            line=dict(width=2, dash='dash', color='red')
+        ))
+    
+    patched = Patch()
+    patched['data'] = traces
+    patched['layout']['title'] = dict(text=f"AI Investment Over Time ({yearly_data['count'].sum()} data points)")
+    patched['layout']['annotations'] = []
+    return patched
+
+
+def update_investment_by_source(db, year_range, detailed=False):
+    """Show distribution of data sources; the detailed view keeps the top 10."""
+    
+    # Count metrics in the year range by source
+    source_counts = get_source_counts(db, INVESTMENT_TYPES, year_range[0], year_range[1])
+    
+    if source_counts.empty:
+        patched = no_data_patch("No data for selected period")
+        patched['data'][0]['labels'] = []
+        patched['data'][0]['values'] = []
+        return patched
+    
+    # Create pie chart, merging sources that clean up to the same name
+    labels = clean_source_names(source_counts['source'], trim_pdf_names=detailed)
+    df = source_counts.groupby(labels, sort=False)['count'].sum().rename_axis('Source').reset_index(name='Count')
+    df = df.sort_values('Count', ascending=False)
+    if detailed:
+        df = df.head(10)  # Top 10 sources
+    
+    patched = Patch()
+    patched['data'][0]['labels'] = df['Source'].tolist()
+    patched['data'][0]['values'] = df['Count'].tolist()
+    patched['layout']['title'] = dict(text=f"Data Sources ({source_counts['count'].sum()} total metrics)")
+    patched['layout']['annotations'] = []
+    return patched
+
+
+def update_investment_table(db, metric_type, year_range, detailed=False):
+    """Show raw investment data in a table; the detailed view adds confidences."""
+    
+    # Filter dollar amounts in the year range with array masks
+    df = compute_dataframe(db)
+    years = df['year'].to_numpy()
+    mask = df['is_money'].to_numpy() & (years >= year_range[0]) & (years <= year_range[1])
+    if metric_type != 'all':
+        mask &= (df['metric_type'] == metric_type).to_numpy()
+    filtered = df[mask]
+    
+    # Top 20 by year, then value, without sorting the whole frame
+    top = filtered.nlargest(20, ['year', 'value'])
+    display_metrics = top.astype(object).where(top.notna(), None).to_dict('records')
+    
+    if not display_metrics:
+        return html.P("No investment data found for selected criteria", className="text-muted")
+    
+    rows = []
+    for metric in display_metrics:
+        # Format value
+        if metric['unit'] == 'millions_usd':
+            value_str = f"${metric['value']:,.0f}M"
+        else:
+            value_str = f"${metric['value']:,.1f}B"
+        
+        if detailed:
+            # Clean source name
+            source = metric.get('source', 'Unknown')
+            if '.pdf' in source:
+                source = source.replace('.pdf', '').replace('_', ' ')[:30]
+            
+            rows.append({
+                'year': str(metric['year']),
+                'source': source,
+                'region': metric.get('country', metric.get('region', 'Global')),
+                'value': value_str,
+                'confidence': f"{metric.get('confidence', 1.0):.0%}",
+                'context': metric.get('context', '')[:80] + '...' if metric.get('context') else ''
+            })
+        else:
+            rows.append({
+                'year': str(metric['year']),
+                'source': metric.get('source', 'Unknown')[:30],
+                'region': metric.get('country', 'Global'),
+                'value': value_str,
+                'context': metric.get('context', '')[:100] + '...' if metric.get('context') else ''
+            })
+    
+    # Rows are sent as plain records and rendered by the table in the browser
+    table = dash_table.DataTable(
+        columns=DETAILED_TABLE_COLUMNS if detailed else TABLE_COLUMNS,
+        data=rows,
+        page_size=20,
+        style_as_list_view=True,
+        style_cell={'textAlign': 'left', 'padding': '4px'},
+        style_data={'whiteSpace': 'normal', 'height': 'auto'},
+        style_header={'fontWeight': 'bold'}
+    )
+    
+    return [
+        html.P(f"Showing top 20 of {len(filtered)} investment metrics", className="text-muted mb-2"),
+        table
+    ]
+
+
+def register_callbacks(app, db, detailed=False):
+    """Register the investment view's callbacks on app, reading from db."""
+    
+    @app.callback(
+        Output("investment-time-series", "figure"),
+        [Input("investment-type-dropdown", "value"),
+         Input("investment-year-slider", "value")]
+    )
+    def _update_time_series(metric_type, year_range):
+        return update_investment_time_series(db, metric_type, year_range)
+    
+    @app.callback(
+        Output("investment-by-source", "figure"),
+        Input("investment-year-slider", "value")
+    )
+    def _update_by_source(year_range):
+        return update_investment_by_source(db, year_range, detailed)
+    
+    @app.callback(
+        Output("investment-data-table", "children"),
+        [Input("investment-type-dropdown", "value"),
+         Input("investment-year-slider", "value")]
+    )
+    def _update_table(metric_type, year_range):
+        return update_investment_table(db, metric_type, year_range, detailed)
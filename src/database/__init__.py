@@ -5,7 +5,7 @@ Provides SQLite database functionality for storing and querying AI metrics.
 """
 
 from .models import (
-    DataSource, AIMetric, ConflictingMetric, ExtractionLog,
+    DataSource, AIMetric, ConflictingMetric, MetricGroupStats, ExtractionLog,
     get_engine, create_tables, get_session
 )
 from .operations import MetricsDatabase, DatabaseError, session_scope
@@ -14,6 +14,7 @@ __all__ = [
     'DataSource',
     'AIMetric', 
     'ConflictingMetric',
+    'MetricGroupStats',
     'ExtractionLog',
     'get_engine',
     'create_tables',
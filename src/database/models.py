@@ -6,13 +6,15 @@ Follows best practices for data integrity and query performance.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 from sqlalchemy import (
-    create_engine, Column, Integer, Float, String, 
+    create_engine, event, text, Column, Integer, Float, String, 
     DateTime, ForeignKey, Index, UniqueConstraint, Text
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 
 Base = declarative_base()
 
@@ -72,9 +74,17 @@ class AIMetric(Base):
     
     # Indexes for performance
     __table_args__ = (
-        Index('idx_metric_type_year', 'metric_type', 'year'),
+        # Metrics of a type in year and confidence order, without a sort;
+        # also serves every lookup on (metric_type) or (metric_type, year)
+        Index('idx_metric_type_year_conf', 'metric_type', 'year', 'confidence'),
+        # Latest-value and time-series lookups per metric and region
+        Index('idx_metric_type_region_year', 'metric_type', 'region', 'year'),
+        # Covering index for the per-year sums: filters on type, year range
+        # and unit, and reads value without touching the table
+        Index('idx_metric_type_year_unit', 'metric_type', 'year', 'unit', 'value'),
         Index('idx_metric_source', 'source_id'),
-        Index('idx_metric_sector', 'sector'),
+        # Most metrics have no sector, so only index the ones that do
+        Index('idx_metric_sector_notnull', 'sector', sqlite_where=text('sector IS NOT NULL')),
         Index('idx_metric_region', 'region'),
         # Prevent exact duplicates
         UniqueConstraint('source_id', 'metric_type', 'value', 'unit', 'year', 
@@ -105,6 +115,28 @@ class ConflictingMetric(Base):
     )
 
 
+class MetricGroupStats(Base):
+    """Aggregate metric values per type, year, unit and sector."""
+    __tablename__ = 'metric_group_stats'
+    
+    id = Column(Integer, primary_key=True)
+    metric_type = Column(String(100), nullable=False)
+    year = Column(Integer, nullable=False)
+    unit = Column(String(50), nullable=False)
+    # '' for metrics without a sector, so the group key is never NULL
+    sector = Column(String(100), nullable=False, default='')
+    
+    count = Column(Integer, nullable=False)
+    min_value = Column(Float, nullable=False)
+    max_value = Column(Float, nullable=False)
+    sum_value = Column(Float, nullable=False)
+    
+    # One row per group
+    __table_args__ = (
+        UniqueConstraint('metric_type', 'year', 'unit', 'sector', name='uq_metric_group'),
+    )
+
+
 class ExtractionLog(Base):
     """Track extraction runs for debugging and auditing."""
     __tablename__ = 'extraction_logs'
@@ -130,9 +162,40 @@ class ExtractionLog(Base):
     )
 
 
+# Applied to every new SQLite connection
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",  # Readers don't block on a writer (or each other)
+    "synchronous": "NORMAL",  # Safe with WAL, far fewer fsyncs
+    "temp_store": "MEMORY",  # Sorts and temp tables stay in RAM
+    "mmap_size": 268435456,  # Read the database through a 256 MB memory map
+    "cache_size": -65536,  # 64 MB page cache per connection (negative = KiB)
+}
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {pragma}={value}")
+    cursor.close()
+
+
 # Database connection and session management
 def get_engine(db_path: str = "data/processed/economics_ai.db"):
     """Create database engine with optimized settings."""
+    if db_path == ":memory:":
+        # Every connection would get its own empty database, so share one
+        pool_settings = {"poolclass": StaticPool}
+    else:
+        # Connection pool settings: keep database files open between sessions
+        pool_settings = {
+            "poolclass": QueuePool,
+            "pool_size": 8,  # Connections reused across dashboard callbacks
+            "max_overflow": 10,  # Extra connections under bursts of load
+            "pool_recycle": 3600,  # Reopen connections after an hour
+            "pool_pre_ping": True,  # Verify connections before use
+        }
+    
     engine = create_engine(
         f"sqlite:///{db_path}",
         # Performance optimizations for SQLite
@@ -140,10 +203,10 @@ def get_engine(db_path: str = "data/processed/economics_ai.db"):
             "check_same_thread": False,  # Allow multi-threading
             "timeout": 30,  # 30 second timeout
         },
-        # Connection pool settings
-        pool_pre_ping=True,  # Verify connections before use
-        echo=False  # Set to True for SQL debugging
+        echo=False,  # Set to True for SQL debugging
+        **pool_settings
     )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
     return engine
 
 
@@ -152,10 +215,22 @@ def create_tables(engine):
     Base.metadata.create_all(bind=engine)
 
 
+@lru_cache(maxsize=None)
+def _session_factory(engine):
+    """One sessionmaker per engine, reused by every get_session call."""
+    return sessionmaker(
+        bind=engine,
+        # Sessions are short transactions that flush explicitly when they
+        # need an id, so don't check pending objects before every query
+        autoflush=False,
+        # Objects stay readable after commit without a reload per attribute
+        expire_on_commit=False
+    )
+
+
 def get_session(engine):
     """Get a database session."""
-    Session = sessionmaker(bind=engine)
-    return Session()
+    return _session_factory(engine)()
 
 
 # Example usage and best practices
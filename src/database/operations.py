@@ -6,20 +6,36 @@ error handling, transaction management, and data validation.
 """
 
 import logging
+import time
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 from contextlib import contextmanager
 
+import numpy as np
+import pandas as pd
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy import and_, or_, func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import and_, or_, func, case, inspect, select, text, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from .models import (
     get_engine, get_session, create_tables,
-    DataSource, AIMetric, ConflictingMetric, ExtractionLog
+    DataSource, AIMetric, ConflictingMetric, MetricGroupStats, ExtractionLog
 )
 
+# Columns of the uq_metric unique constraint
+UQ_METRIC_COLUMNS = ['source_id', 'metric_type', 'value', 'unit', 'year', 'sector', 'region']
+
+# Columns of the uq_metric_group unique constraint
+GROUP_STATS_KEY = ['metric_type', 'year', 'unit', 'sector']
+
+# Indexes dropped from the models, removed from databases that still have them
+RETIRED_INDEXES = {'idx_metric_type_year'}
+
+# Database files whose schema this process has already set up
+_INITIALIZED = set()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -30,6 +46,18 @@ class DatabaseError(Exception):
     pass
 
 
+def _spread_exceeds(low: float, high: float, threshold: float) -> bool:
+    """
+    Whether two values between low and high could differ by more than
+    threshold, relative to the larger of the two.
+    """
+    if low < 0 < high:
+        # Opposite signs are at least 100% apart, so don't rule it out
+        return True
+    largest = max(abs(low), abs(high))
+    return largest != 0 and (high - low) / largest > threshold
+
+
 @contextmanager
 def session_scope(engine):
     """
@@ -52,21 +80,93 @@ def session_scope(engine):
 class MetricsDatabase:
     """Main interface for database operations."""
     
+    # Seconds a summary is reused, to pick up writes from other processes
+    STATS_TTL = 300
+    
     def __init__(self, db_path: str = "data/processed/economics_ai.db"):
         """Initialize database connection."""
         self.db_path = db_path
         self.engine = get_engine(db_path)
         
+        # Bumped by every write through this instance, so cached results
+        # computed before it are recognized as stale
+        self._write_version = 0
+        self._stats_cache = None  # (write version, time computed, stats)
+        
+        # Ids of sources known to be stored, by name
+        self._source_ids = {}
+        
         # Ensure database exists
         self._ensure_database()
     
     def _ensure_database(self):
         """Create database and tables if they don't exist."""
+        # An in-memory database is new with every engine
+        db_file = None if self.db_path == ":memory:" else Path(self.db_path).resolve()
+        if db_file in _INITIALIZED and db_file.exists():
+            return
+        
         try:
+            has_group_stats = inspect(self.engine).has_table(MetricGroupStats.__tablename__)
             create_tables(self.engine)
+            # create_tables skips existing tables, so add any newer indexes,
+            # drop retired ones and refresh the planner statistics
+            existing = {index['name'] for index in inspect(self.engine).get_indexes(AIMetric.__tablename__)}
+            missing = [index for index in AIMetric.__table__.indexes if index.name not in existing]
+            for index in missing:
+                index.create(self.engine)
+            retired = sorted(existing & RETIRED_INDEXES)
+            if missing or retired:
+                with self.engine.begin() as connection:
+                    for name in retired:
+                        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+                    connection.execute(text("ANALYZE"))
+            # Fill in the group stats of metrics stored before they existed
+            if not has_group_stats:
+                with session_scope(self.engine) as session:
+                    self._refresh_group_stats(session)
             logger.info(f"Database initialized at: {self.db_path}")
         except Exception as e:
             raise DatabaseError(f"Failed to initialize database: {e}")
+        
+        if db_file is not None:
+            _INITIALIZED.add(db_file)
+    
+    def _refresh_group_stats(self, session: Session, keys=None):
+        """
+        Recompute the MetricGroupStats rows from the stored metrics.
+        
+        Args:
+            session: Session of the transaction that changed the metrics
+            keys: (metric_type, year) pairs to refresh, or None for all
+        """
+        sector = func.coalesce(AIMetric.sector, '')
+        query = session.query(
+            AIMetric.metric_type,
+            AIMetric.year,
+            AIMetric.unit,
+            sector.label('sector'),
+            func.count().label('count'),
+            func.min(AIMetric.value).label('min_value'),
+            func.max(AIMetric.value).label('max_value'),
+            func.sum(AIMetric.value).label('sum_value')
+        )
+        if keys is not None:
+            query = query.filter(tuple_(AIMetric.metric_type, AIMetric.year).in_(list(keys)))
+        rows = [row._asdict() for row in query.group_by(
+            AIMetric.metric_type, AIMetric.year, AIMetric.unit, sector
+        )]
+        
+        if rows:
+            stmt = sqlite_insert(MetricGroupStats.__table__)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=GROUP_STATS_KEY,
+                set_={
+                    column: stmt.excluded[column]
+                    for column in ('count', 'min_value', 'max_value', 'sum_value')
+                }
+            )
+            session.execute(stmt, rows)
     
     def add_source(self, name: str, organization: str = None, 
                    pdf_path: str = None, url: str = None,
@@ -80,10 +180,10 @@ class MetricsDatabase:
         """
         with session_scope(self.engine) as session:
             # Check if source already exists
-            existing = session.query(DataSource).filter_by(name=name).first()
-            if existing:
+            existing_id = self._get_source_id(session, name)
+            if existing_id is not None:
                 logger.info(f"Source already exists: {name}")
-                return existing.id
+                return existing_id
             
             source = DataSource(
                 name=name,
@@ -97,14 +197,31 @@ class MetricsDatabase:
             session.add(source)
             session.flush()  # Get the ID before commit
             source_id = source.id
-            
-            logger.info(f"Added source: {name} (ID: {source_id})")
-            return source_id
+            self._write_version += 1
+        
+        # Only remembered once committed
+        self._source_ids[name] = source_id
+        logger.info(f"Added source: {name} (ID: {source_id})")
+        return source_id
+    
+    def _get_source_id(self, session: Session, name: str) -> Optional[int]:
+        """Id of the named source, or None if it isn't stored yet."""
+        source_id = self._source_ids.get(name)
+        if source_id is None:
+            source_id = session.query(DataSource.id).filter_by(name=name).scalar()
+            if source_id is not None:
+                self._source_ids[name] = source_id
+        return source_id
     
     def add_metrics_batch(self, metrics: List[Dict], source_name: str) -> Tuple[int, int]:
         """
         Add multiple metrics in a single transaction.
         
+        Metrics identical to one already stored for the source, or to an
+        earlier one in the batch, are skipped as duplicates. The rest are
+        inserted together in one INSERT ... ON CONFLICT DO NOTHING
+        statement.
+        
         Args:
             metrics: List of metric dictionaries
             source_name: Name of the data source
@@ -112,50 +229,78 @@ class MetricsDatabase:
         Returns:
             (success_count, duplicate_count)
         """
-        success_count = 0
         duplicate_count = 0
         
         with session_scope(self.engine) as session:
             # Get or create source
-            source = session.query(DataSource).filter_by(name=source_name).first()
-            if not source:
+            source_id = self._get_source_id(session, source_name)
+            if source_id is None:
                 # Create source if it doesn't exist
                 source = DataSource(name=source_name)
                 session.add(source)
                 session.flush()
+                source_id = source.id
+            
+            # Fields of the uq_metric constraint, already stored for this
+            # source. Checked here as well as by the constraint because
+            # SQLite treats NULL sectors and regions as never equal
+            seen = set(session.query(
+                AIMetric.metric_type,
+                AIMetric.value,
+                AIMetric.unit,
+                AIMetric.year,
+                AIMetric.sector,
+                AIMetric.region
+            ).filter(AIMetric.source_id == source_id).all())
             
+            rows = []
             for metric_data in metrics:
                 try:
-                    metric = AIMetric(
-                        source_id=source.id,
-                        metric_type=metric_data['metric_type'],
-                        value=float(metric_data['value']),
-                        unit=metric_data['unit'],
-                        year=int(metric_data.get('year', 2025)),
-                        sector=metric_data.get('sector'),
-                        region=metric_data.get('region'),
-                        technology=metric_data.get('technology'),
-                        context=metric_data.get('context'),
-                        confidence=float(metric_data.get('confidence', 1.0)),
-                        page_number=metric_data.get('page_number')
-                    )
-                    
-                    session.add(metric)
-                    success_count += 1
-                    
-                except IntegrityError:
-                    # Handle duplicates gracefully
-                    session.rollback()
-                    duplicate_count += 1
-                    continue
-                except Exception as e:
+                    row = {
+                        'source_id': source_id,
+                        'metric_type': metric_data['metric_type'],
+                        'value': float(metric_data['value']),
+                        'unit': metric_data['unit'],
+                        'year': int(metric_data.get('year', 2025)),
+                        'sector': metric_data.get('sector'),
+                        'region': metric_data.get('region'),
+                        'technology': metric_data.get('technology'),
+                        'context': metric_data.get('context'),
+                        'confidence': float(metric_data.get('confidence', 1.0)),
+                        'page_number': metric_data.get('page_number')
+                    }
+                except (KeyError, TypeError, ValueError) as e:
                     logger.error(f"Failed to add metric: {e}")
-                    session.rollback()
                     continue
+                
+                # Handle duplicates gracefully
+                key = (row['metric_type'], row['value'], row['unit'],
+                       row['year'], row['sector'], row['region'])
+                if key in seen:
+                    duplicate_count += 1
+                    continue
+                seen.add(key)
+                rows.append(row)
+            
+            success_count = 0
+            if rows:
+                # Let the unique constraint drop anything stored since the
+                # lookup above instead of failing the whole batch
+                stmt = sqlite_insert(AIMetric.__table__).on_conflict_do_nothing(
+                    index_elements=UQ_METRIC_COLUMNS
+                )
+                success_count = session.execute(stmt, rows).rowcount
+                duplicate_count += len(rows) - success_count
+            
+            # Keep the group stats in step, in the same transaction
+            if success_count:
+                self._refresh_group_stats(
+                    session, {(row['metric_type'], row['year']) for row in rows}
+                )
             
             # Log the extraction
             log_entry = ExtractionLog(
-                source_id=source.id,
+                source_id=source_id,
                 extraction_type='batch_import',
                 status='success',
                 metrics_extracted=success_count,
@@ -163,6 +308,8 @@ class MetricsDatabase:
             )
             session.add(log_entry)
         
+        self._write_version += 1
+        self._source_ids[source_name] = source_id
         logger.info(f"Added {success_count} metrics, {duplicate_count} duplicates skipped")
         return success_count, duplicate_count
     
@@ -175,7 +322,20 @@ class MetricsDatabase:
         Returns list of metric dictionaries with source information.
         """
         with session_scope(self.engine) as session:
-            query = session.query(AIMetric).join(DataSource)
+            # Read the source fields in the same query rather than loading
+            # each metric's source relationship
+            query = session.query(
+                AIMetric.id,
+                AIMetric.value,
+                AIMetric.unit,
+                AIMetric.year,
+                AIMetric.sector,
+                AIMetric.region,
+                AIMetric.confidence,
+                DataSource.name.label('source'),
+                DataSource.organization,
+                AIMetric.context
+            ).select_from(AIMetric).join(AIMetric.source)
             
             # Apply filters
             query = query.filter(AIMetric.metric_type == metric_type)
@@ -184,25 +344,168 @@ class MetricsDatabase:
             if sector:
                 query = query.filter(AIMetric.sector == sector)
             
-            # Order by year and confidence
-            query = query.order_by(AIMetric.year.desc(), AIMetric.confidence.desc())
-            
-            results = []
-            for metric in query.all():
-                results.append({
-                    'id': metric.id,
-                    'value': metric.value,
-                    'unit': metric.unit,
-                    'year': metric.year,
-                    'sector': metric.sector,
-                    'region': metric.region,
-                    'confidence': metric.confidence,
-                    'source': metric.source.name,
-                    'organization': metric.source.organization,
-                    'context': metric.context
-                })
-            
-            return results
+            # Order by year and confidence, newest rows first among ties,
+            # which is the order of the (metric_type, year, confidence) index
+            query = query.order_by(AIMetric.year.desc(), AIMetric.confidence.desc(), AIMetric.id.desc())
+            
+            return [row._asdict() for row in query]
+    
+    def get_metrics_df(self, metric_types: List[str],
+                       year_min: Optional[int] = None,
+                       year_max: Optional[int] = None) -> pd.DataFrame:
+        """
+        Retrieve metrics of several types straight into a DataFrame.
+        
+        The fields of get_metrics_by_type plus each metric's metric_type,
+        grouped by type in the order given and ordered by year and
+        confidence within each type. The rows are read from the cursor
+        into typed columns by pandas, without building a dictionary per
+        metric first.
+        
+        Args:
+            metric_types: Types of metric to retrieve
+            year_min: First year to include, if given
+            year_max: Last year to include, if given
+        """
+        metric_types = list(metric_types)
+        
+        with session_scope(self.engine) as session:
+            query = session.query(
+                AIMetric.id,
+                AIMetric.metric_type,
+                AIMetric.value,
+                AIMetric.unit,
+                AIMetric.year,
+                AIMetric.sector,
+                AIMetric.region,
+                AIMetric.confidence,
+                DataSource.name.label('source'),
+                DataSource.organization,
+                AIMetric.context
+            ).select_from(AIMetric).join(AIMetric.source).filter(
+                AIMetric.metric_type.in_(metric_types)
+            )
+            if year_min is not None:
+                query = query.filter(AIMetric.year >= year_min)
+            if year_max is not None:
+                query = query.filter(AIMetric.year <= year_max)
+            if metric_types:
+                type_order = case(
+                    {metric_type: i for i, metric_type in enumerate(metric_types)},
+                    value=AIMetric.metric_type
+                )
+                query = query.order_by(
+                    type_order, AIMetric.year.desc(), AIMetric.confidence.desc(), AIMetric.id
+                )
+            
+            # Years fit in int16; values stay float64 so totals match the database
+            return pd.read_sql_query(
+                query.statement,
+                session.connection(),
+                dtype={'year': 'int16', 'value': 'float64'}
+            )
+    
+    def get_latest_value(self, metric_type: str, region: str = 'Global') -> Optional[Dict]:
+        """
+        Get the most recent value of a metric for a region.
+        
+        Served by the (metric_type, region, year) index, so only the newest
+        row is read. Ties within a year go to the highest confidence.
+        
+        Returns:
+            Dictionary with value, unit and year, or None if there is no data
+        """
+        with session_scope(self.engine) as session:
+            row = session.query(
+                AIMetric.value,
+                AIMetric.unit,
+                AIMetric.year
+            ).filter(
+                AIMetric.metric_type == metric_type,
+                AIMetric.region == region
+            ).order_by(AIMetric.year.desc(), AIMetric.confidence.desc()).first()
+            
+            if row:
+                return {'value': row.value, 'unit': row.unit, 'year': row.year}
+            return None
+    
+    def get_time_series_multi(self, metric_type: str, regions: List[str],
+                              year_min: int, year_max: int) -> pd.DataFrame:
+        """
+        Retrieve one metric's values for several regions in a single query.
+        
+        Args:
+            metric_type: Type of metric to retrieve
+            regions: Regions (countries) to include
+            year_min: First year to include
+            year_max: Last year to include
+            
+        Returns:
+            DataFrame with region, year, value and unit columns, ordered by
+            region and year
+        """
+        with session_scope(self.engine) as session:
+            rows = session.query(
+                AIMetric.region,
+                AIMetric.year,
+                AIMetric.value,
+                AIMetric.unit
+            ).filter(
+                AIMetric.metric_type == metric_type,
+                AIMetric.region.in_(regions),
+                AIMetric.year.between(year_min, year_max)
+            ).order_by(AIMetric.region, AIMetric.year).all()
+            
+            return pd.DataFrame(rows, columns=['region', 'year', 'value', 'unit'])
+    
+    def get_yearly_sums(self, metric_types: List[str], year_min: int, year_max: int,
+                        units: List[str] = ('millions_usd', 'billions_usd', 'percentage')) -> pd.DataFrame:
+        """
+        Sum metric values per year inside the database.
+        
+        Values in millions_usd are converted to billions; other units are
+        summed as stored.
+        
+        Returns:
+            DataFrame with year, sum and count columns, ordered by year
+        """
+        value_billions = case(
+            (AIMetric.unit == 'millions_usd', AIMetric.value / 1000.0),
+            else_=AIMetric.value
+        )
+        
+        with session_scope(self.engine) as session:
+            rows = session.query(
+                AIMetric.year,
+                func.sum(value_billions),
+                func.count(AIMetric.id)
+            ).filter(
+                AIMetric.metric_type.in_(list(metric_types)),
+                AIMetric.unit.in_(list(units)),
+                AIMetric.year.between(year_min, year_max)
+            ).group_by(AIMetric.year).order_by(AIMetric.year).all()
+            
+            return pd.DataFrame(rows, columns=['year', 'sum', 'count'])
+    
+    def get_source_counts(self, metric_types: List[str],
+                          year_min: int, year_max: int) -> pd.DataFrame:
+        """
+        Count metrics per data source inside the database.
+        
+        Returns:
+            DataFrame with source and count columns, largest count first
+        """
+        with session_scope(self.engine) as session:
+            count = func.count(AIMetric.id)
+            rows = session.query(
+                DataSource.name,
+                count
+            ).select_from(AIMetric).join(AIMetric.source).filter(
+                AIMetric.metric_type.in_(list(metric_types)),
+                AIMetric.year.between(year_min, year_max)
+            ).group_by(DataSource.name).order_by(count.desc(), DataSource.name).all()
+            
+            return pd.DataFrame(rows, columns=['source', 'count'])
     
     def find_conflicts(self, metric_type: str, year: int, 
                       threshold: float = 0.1) -> List[Dict]:
@@ -218,50 +521,93 @@ class MetricsDatabase:
             List of conflict dictionaries
         """
         with session_scope(self.engine) as session:
-            # Get all metrics of this type and year
-            metrics = session.query(AIMetric).join(DataSource).filter(
+            # The group stats bound how far apart the values of each unit
+            # can be, so most calls never need to compare metrics
+            unit_ranges = session.query(
+                MetricGroupStats.unit,
+                func.sum(MetricGroupStats.count),
+                func.min(MetricGroupStats.min_value),
+                func.max(MetricGroupStats.max_value)
+            ).filter(
+                MetricGroupStats.metric_type == metric_type,
+                MetricGroupStats.year == year
+            ).group_by(MetricGroupStats.unit).all()
+            
+            # Metrics are only compared within a unit, so only the units
+            # that may hold a conflict are worth loading
+            flagged_units = [
+                unit for unit, count, low, high in unit_ranges
+                if count > 1 and _spread_exceeds(low, high, threshold)
+            ]
+            if not flagged_units:
+                return []
+            
+            # Get the metrics of this type and year in those units, as plain columns
+            rows = session.query(
+                AIMetric.value,
+                AIMetric.unit,
+                AIMetric.sector,
+                AIMetric.region,
+                DataSource.name
+            ).join(AIMetric.source).filter(
                 and_(
                     AIMetric.metric_type == metric_type,
-                    AIMetric.year == year
+                    AIMetric.year == year,
+                    AIMetric.unit.in_(flagged_units)
                 )
-            ).all()
+            ).order_by(AIMetric.id).all()
             
-            if len(metrics) < 2:
+            if len(rows) < 2:
                 return []
             
-            conflicts = []
+            # Object arrays keep missing sectors as None, not NaN
+            values = np.array([row.value for row in rows], dtype=np.float64)
+            sectors = np.array([row.sector for row in rows], dtype=object)
+            has_sector = sectors.astype(bool)
+            unit_codes, units = pd.factorize(np.array([row.unit for row in rows], dtype=object))
             
-            # Compare metrics pairwise
-            for i in range(len(metrics)):
-                for j in range(i + 1, len(metrics)):
-                    m1, m2 = metrics[i], metrics[j]
-                    
-                    # Skip if different units or sectors
-                    if m1.unit != m2.unit:
-                        continue
-                    if m1.sector != m2.sector and (m1.sector and m2.sector):
-                        continue
-                    
-                    # Calculate relative difference
-                    # Handle zero values
-                    max_value = max(abs(m1.value), abs(m2.value))
-                    if max_value == 0:
-                        continue
-                    diff = abs(m1.value - m2.value) / max_value
-                    
-                    if diff > threshold:
-                        conflicts.append({
-                            'metric_type': metric_type,
-                            'year': year,
-                            'value1': m1.value,
-                            'value2': m2.value,
-                            'unit': m1.unit,
-                            'source1': m1.source.name,
-                            'source2': m2.source.name,
-                            'difference_pct': round(diff * 100, 2),
-                            'sector': m1.sector or m2.sector,
-                            'region': m1.region or m2.region
-                        })
+            # Compare metrics pairwise, only within each unit, as arrays
+            firsts, seconds, diffs = [], [], []
+            for code in range(len(units)):
+                positions = np.flatnonzero(unit_codes == code)
+                if len(positions) < 2:
+                    continue
+                i, j = np.triu_indices(len(positions), k=1)
+                i, j = positions[i], positions[j]
+                
+                # Skip pairs from different sectors, when both have one
+                same_sector = (sectors[i] == sectors[j]) | ~has_sector[i] | ~has_sector[j]
+                
+                # Calculate relative difference
+                # Handle zero values
+                max_value = np.maximum(np.abs(values[i]), np.abs(values[j]))
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    diff = np.abs(values[i] - values[j]) / max_value
+                
+                conflicting = same_sector & (max_value != 0) & (diff > threshold)
+                firsts.append(i[conflicting])
+                seconds.append(j[conflicting])
+                diffs.append(diff[conflicting])
+            
+            conflicts = []
+            if firsts:
+                firsts, seconds, diffs = map(np.concatenate, (firsts, seconds, diffs))
+                
+                # Report pairs in the order of the metrics
+                for k in np.lexsort((seconds, firsts)):
+                    m1, m2 = rows[firsts[k]], rows[seconds[k]]
+                    conflicts.append({
+                        'metric_type': metric_type,
+                        'year': year,
+                        'value1': m1.value,
+                        'value2': m2.value,
+                        'unit': m1.unit,
+                        'source1': m1.name,
+                        'source2': m2.name,
+                        'difference_pct': round(float(diffs[k]) * 100, 2),
+                        'sector': m1.sector or m2.sector,
+                        'region': m1.region or m2.region
+                    })
             
             # Record conflicts
             if conflicts:
@@ -275,24 +621,40 @@ class MetricsDatabase:
             return conflicts
     
     def get_summary_stats(self) -> Dict:
-        """Get database summary statistics."""
+        """
+        Get database summary statistics.
+        
+        The result is cached until this instance writes to the database or
+        STATS_TTL seconds pass; callers must not modify it.
+        """
+        if self._stats_cache:
+            version, computed_at, stats = self._stats_cache
+            if version == self._write_version and time.monotonic() - computed_at < self.STATS_TTL:
+                return stats
+        
+        version = self._write_version
         with session_scope(self.engine) as session:
+            # Every per-metric aggregate in one scan of ai_metrics;
+            # COUNT(DISTINCT) skips the NULL sectors and regions
+            totals = session.execute(select(
+                select(func.count(DataSource.id)).scalar_subquery().label('total_sources'),
+                func.count(AIMetric.id).label('total_metrics'),
+                func.count(func.distinct(AIMetric.metric_type)).label('metric_types'),
+                func.min(AIMetric.year).label('min_year'),
+                func.max(AIMetric.year).label('max_year'),
+                func.count(func.distinct(AIMetric.sector)).label('sectors'),
+                func.count(func.distinct(AIMetric.region)).label('regions'),
+                func.avg(AIMetric.confidence).label('avg_confidence')
+            )).one()
+            
             stats = {
-                'total_sources': session.query(DataSource).count(),
-                'total_metrics': session.query(AIMetric).count(),
-                'metric_types': session.query(
-                    func.distinct(AIMetric.metric_type)
-                ).count(),
-                'year_range': session.query(
-                    func.min(AIMetric.year),
-                    func.max(AIMetric.year)
-                ).first(),
-                'sectors': session.query(
-                    func.distinct(AIMetric.sector)
-                ).filter(AIMetric.sector.isnot(None)).count(),
-                'avg_confidence': session.query(
-                    func.avg(AIMetric.confidence)
-                ).scalar()
+                'total_sources': totals.total_sources,
+                'total_metrics': totals.total_metrics,
+                'metric_types': totals.metric_types,
+                'year_range': (totals.min_year, totals.max_year),
+                'sectors': totals.sectors,
+                'regions': totals.regions,
+                'avg_confidence': totals.avg_confidence
             }
             
             # Get metrics by type
@@ -302,31 +664,34 @@ class MetricsDatabase:
             ).group_by(AIMetric.metric_type).all()
             
             stats['metrics_by_type'] = dict(type_counts)
-            
-            return stats
+        
+        self._stats_cache = (version, time.monotonic(), stats)
+        return stats
     
     def export_to_dict(self, limit: Optional[int] = None) -> Dict:
         """Export all metrics as dictionary for analysis."""
         with session_scope(self.engine) as session:
-            query = session.query(AIMetric).join(DataSource)
+            # Plain columns with the source joined in, so no ORM objects
+            # or per-row source loads
+            stmt = select(
+                AIMetric.metric_type,
+                AIMetric.value,
+                AIMetric.unit,
+                AIMetric.year,
+                AIMetric.sector,
+                AIMetric.region,
+                AIMetric.technology,
+                AIMetric.confidence,
+                DataSource.name.label('source'),
+                DataSource.organization
+            ).join(AIMetric.source).order_by(AIMetric.id)
             
             if limit:
-                query = query.limit(limit)
-            
-            metrics = []
-            for metric in query.all():
-                metrics.append({
-                    'metric_type': metric.metric_type,
-                    'value': metric.value,
-                    'unit': metric.unit,
-                    'year': metric.year,
-                    'sector': metric.sector,
-                    'region': metric.region,
-                    'technology': metric.technology,
-                    'confidence': metric.confidence,
-                    'source': metric.source.name,
-                    'organization': metric.source.organization
-                })
+                stmt = stmt.limit(limit)
+            
+            # Fetch rows in chunks rather than all at once
+            result = session.execute(stmt.execution_options(yield_per=1000))
+            metrics = [dict(row) for row in result.mappings()]
             
             return {
                 'metrics': metrics,
@@ -1,29 +1,36 @@
 """Analyze validation results from UI testing"""
 
-import json
 from pathlib import Path
 from collections import Counter
 
+from json_stream import iter_json_array
+
 def analyze_results():
     """Analyze the validation decisions"""
     
     validated_file = Path("extraction_output/oecd-artificial-intelligence-review-2025.pdf_validated.json")
     
+    # Count decisions and keep the accepted items in one pass over the
+    # file, without holding every validated item in memory
+    decisions = Counter()
+    accepted = []
+    
     with open(validated_file, 'r') as f:
-        validated = json.load(f)
+        for item in iter_json_array(f):
+            decision = item['decision']
+            decisions[decision] += 1
+            if decision == 'accept':
+                accepted.append(item)
     
-    print(f"Total validated candidates: {len(validated)}")
+    validated_count = decisions.total()
     
-    # Count decisions
-    decisions = Counter(item['decision'] for item in validated)
+    print(f"Total validated candidates: {validated_count}")
     
     print("\nValidation decisions:")
     for decision, count in decisions.items():
         print(f"  {decision}: {count}")
     
     # Analyze accepted metrics
-    accepted = [item for item in validated if item['decision'] == 'accept']
-    
     if accepted:
         print(f"\nAccepted metrics: {len(accepted)}")
         print("-" * 60)
@@ -43,7 +50,6 @@ def analyze_results():
     
     # Calculate time spent (if we had timestamps)
     total_candidates = 66
-    validated_count = len(validated)
     
     print(f"Validated: {validated_count}/{total_candidates} ({validated_count/total_candidates*100:.1f}%)")
     
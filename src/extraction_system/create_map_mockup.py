@@ -3,52 +3,74 @@ Create a geographic map mockup with our mismatched extracted data
 Shows the reality of what we have vs what we need
 """
 
-import json
 from pathlib import Path
-import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
 import random
+import hashlib
+import inspect
+import pickle
+from itertools import islice
 
-def find_geographic_data():
-    """Search through our extracted data for any geographic mentions"""
-    
-    geographic_data = []
+from json_stream import iter_json_array
+
+# Geographic patterns to search for
+LOCATIONS = {
+    'United States': {'lat': 39.8283, 'lon': -98.5795, 'type': 'country'},
+    'US': {'lat': 39.8283, 'lon': -98.5795, 'type': 'country'},
+    'China': {'lat': 35.8617, 'lon': 104.1954, 'type': 'country'},
+    'India': {'lat': 20.5937, 'lon': 78.9629, 'type': 'country'},
+    'Europe': {'lat': 54.5260, 'lon': 15.2551, 'type': 'region'},
+    'California': {'lat': 36.7783, 'lon': -119.4179, 'type': 'state'},
+    'Silicon Valley': {'lat': 37.3621, 'lon': -122.0840, 'type': 'region'},
+    'New York': {'lat': 40.7128, 'lon': -74.0060, 'type': 'city'},
+    'Boston': {'lat': 42.3601, 'lon': -71.0589, 'type': 'city'},
+    'Seattle': {'lat': 47.6062, 'lon': -122.3321, 'type': 'city'},
+    'Germany': {'lat': 51.1657, 'lon': 10.4515, 'type': 'country'},
+    'UK': {'lat': 55.3781, 'lon': -3.4360, 'type': 'country'},
+    'Canada': {'lat': 56.1304, 'lon': -106.3468, 'type': 'country'},
+}
+
+# Lowercased names to look for, in order of precedence
+LOCATION_KEYS = [(location.lower(), location) for location in LOCATIONS]
+
+# Matches per candidate file, keyed by path with the file's mtime and size;
+# kept next to the candidate files rather than in the working directory
+GEO_CACHE_FILE = Path('extraction_output') / 'geo_records.pkl'
+
+# The rendered map, and the hash of the data and figure code it was made from
+MAP_FILE = Path('geographic_data_mockup.html')
+MAP_HASH_FILE = Path('extraction_output') / 'geo_map.sha1'
+
+# Coordinates and type per location, joined onto the matched candidates
+LOCATIONS_DF = pd.DataFrame.from_dict(LOCATIONS, orient='index').rename_axis('location').reset_index()
+
+def load_geo_cache():
+    """Matches per candidate file from earlier runs with the same locations"""
+    try:
+        with open(GEO_CACHE_FILE, 'rb') as f:
+            cache = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return {}
     
-    # Geographic patterns to search for
-    locations = {
-        'United States': {'lat': 39.8283, 'lon': -98.5795, 'type': 'country'},
-        'US': {'lat': 39.8283, 'lon': -98.5795, 'type': 'country'},
-        'China': {'lat': 35.8617, 'lon': 104.1954, 'type': 'country'},
-        'India': {'lat': 20.5937, 'lon': 78.9629, 'type': 'country'},
-        'Europe': {'lat': 54.5260, 'lon': 15.2551, 'type': 'region'},
-        'California': {'lat': 36.7783, 'lon': -119.4179, 'type': 'state'},
-        'Silicon Valley': {'lat': 37.3621, 'lon': -122.0840, 'type': 'region'},
-        'New York': {'lat': 40.7128, 'lon': -74.0060, 'type': 'city'},
-        'Boston': {'lat': 42.3601, 'lon': -71.0589, 'type': 'city'},
-        'Seattle': {'lat': 47.6062, 'lon': -122.3321, 'type': 'city'},
-        'Germany': {'lat': 51.1657, 'lon': 10.4515, 'type': 'country'},
-        'UK': {'lat': 55.3781, 'lon': -3.4360, 'type': 'country'},
-        'Canada': {'lat': 56.1304, 'lon': -106.3468, 'type': 'country'},
-    }
+    if cache.get('locations') != LOCATION_KEYS:
+        return {}
+    return cache['files']
+
+def scan_candidate_file(file):
+    """Find the first location mentioned by each of a file's first candidates"""
+    matches = []
     
-    # Read our extracted candidates
-    for file in Path('extraction_output').glob('*_candidates.json'):
-        print(f"Searching {file.name}...")
-        
-        with open(file, 'r', encoding='utf-8') as f:
-            candidates = json.load(f)
-        
-        for candidate in candidates[:100]:  # Check first 100 candidates
+    with open(file, 'r', encoding='utf-8') as f:
+        # Check first 100 candidates, without parsing the rest of the file
+        for candidate in islice(iter_json_array(f), 100):
             text = str(candidate.get('surrounding_text', '')) + ' ' + str(candidate.get('raw_value', ''))
             
-            for location, coords in locations.items():
-                if location.lower() in text.lower():
-                    geographic_data.append({
+            lowered = text.lower()
+            
+            for key, location in LOCATION_KEYS:
+                if key in lowered:
+                    matches.append({
                         'location': location,
-                        'lat': coords['lat'],
-                        'lon': coords['lon'],
-                        'type': coords['type'],
                         'value': candidate.get('numeric_value', 0),
                         'unit': candidate.get('unit_hint', ''),
                         'metric': candidate.get('suggested_category', 'unknown'),
@@ -58,41 +80,56 @@ def find_geographic_data():
                     })
                     break  # Only match first location per candidate
     
-    return geographic_data
+    return matches
 
-def create_reality_map():
-    """Create a map showing the mismatched reality of our data"""
+def find_geographic_data():
+    """Search through our extracted data for any geographic mentions"""
     
-    print("Creating geographic mockup with extracted data...")
+    geographic_data = []
     
-    # Find whatever geographic data we have
-    geo_data = find_geographic_data()
+    # Files unchanged since the last run reuse its matches
+    cached_files = load_geo_cache()
+    scanned_files = {}
     
-    if not geo_data:
-        print("No geographic data found! Creating synthetic example...")
-        # Create synthetic mismatched data to show the problem
-        geo_data = [
-            {'location': 'United States', 'lat': 39.8283, 'lon': -98.5795, 'value': 75, 
-             'unit': '%', 'metric': 'AI adoption', 'source': 'McKinsey', 'context': '75% of US companies...', 'confidence': 0.8},
-            {'location': 'China', 'lat': 35.8617, 'lon': 104.1954, 'value': 2030, 
-             'unit': 'year', 'metric': 'prediction', 'source': 'AI Economy', 'context': 'By 2030, China will...', 'confidence': 0.5},
-            {'location': 'Silicon Valley', 'lat': 37.3621, 'lon': -122.0840, 'value': 15.8, 
-             'unit': 'billion', 'metric': 'investment', 'source': 'Stanford', 'context': '$15.8B invested in...', 'confidence': 0.9},
-            {'location': 'Europe', 'lat': 54.5260, 'lon': 15.2551, 'value': 45, 
-             'unit': '%', 'metric': 'productivity', 'source': 'OECD', 'context': '45% productivity gain...', 'confidence': 0.6},
-            {'location': 'India', 'lat': 20.5937, 'lon': 78.9629, 'value': 500, 
-             'unit': 'companies', 'metric': 'survey size', 'source': 'McKinsey', 'context': 'Survey of 500 companies...', 'confidence': 0.7},
-        ]
+    # Read our extracted candidates
+    for file in Path('extraction_output').glob('*_candidates.json'):
+        print(f"Searching {file.name}...")
+        
+        stat = file.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = cached_files.get(str(file))
+        matches = cached[1] if cached and cached[0] == version else scan_candidate_file(file)
+        
+        scanned_files[str(file)] = (version, matches)
+        geographic_data.extend(matches)
     
-    # Convert to DataFrame
-    df = pd.DataFrame(geo_data)
+    if scanned_files != cached_files:
+        GEO_CACHE_FILE.parent.mkdir(exist_ok=True)
+        with open(GEO_CACHE_FILE, 'wb') as f:
+            pickle.dump({'locations': LOCATION_KEYS, 'files': scanned_files}, f)
+    
+    if not geographic_data:
+        return []
+    
+    # Attach coordinates to all matches at once. Object dtype keeps missing
+    # candidate fields as None rather than NaN
+    matches = pd.DataFrame(geographic_data, dtype=object)
+    result = matches.merge(LOCATIONS_DF, on='location', how='left', validate='many_to_one')
+    columns = ['location', 'lat', 'lon', 'type'] + list(matches.columns[1:])
+    return result[columns].to_dict('records')
+
+def create_map_figure(df):
+    """Map the geographic records in df, one trace per metric type"""
+    # Plotly is only needed to render, so the data scan doesn't import it
+    import plotly.graph_objects as go
+    from plotly.colors import qualitative
     
     # Create the map
     fig = go.Figure()
     
     # Group by metric type for different colors
     metric_types = df['metric'].unique()
-    colors = px.colors.qualitative.Set3[:len(metric_types)]
+    colors = qualitative.Set3[:len(metric_types)]
     
     for i, metric in enumerate(metric_types):
         metric_df = df[df['metric'] == metric]
@@ -162,9 +199,51 @@ def create_reality_map():
         xanchor='center'
     )
     
+    return fig
+
+def create_reality_map():
+    """Create a map showing the mismatched reality of our data"""
+    
+    print("Creating geographic mockup with extracted data...")
+    
+    # Find whatever geographic data we have
+    geo_data = find_geographic_data()
+    
+    if not geo_data:
+        print("No geographic data found! Creating synthetic example...")
+        # Create synthetic mismatched data to show the problem
+        geo_data = [
+            {'location': 'United States', 'lat': 39.8283, 'lon': -98.5795, 'value': 75, 
+             'unit': '%', 'metric': 'AI adoption', 'source': 'McKinsey', 'context': '75% of US companies...', 'confidence': 0.8},
+            {'location': 'China', 'lat': 35.8617, 'lon': 104.1954, 'value': 2030, 
+             'unit': 'year', 'metric': 'prediction', 'source': 'AI Economy', 'context': 'By 2030, China will...', 'confidence': 0.5},
+            {'location': 'Silicon Valley', 'lat': 37.3621, 'lon': -122.0840, 'value': 15.8, 
+             'unit': 'billion', 'metric': 'investment', 'source': 'Stanford', 'context': '$15.8B invested in...', 'confidence': 0.9},
+            {'location': 'Europe', 'lat': 54.5260, 'lon': 15.2551, 'value': 45, 
+             'unit': '%', 'metric': 'productivity', 'source': 'OECD', 'context': '45% productivity gain...', 'confidence': 0.6},
+            {'location': 'India', 'lat': 20.5937, 'lon': 78.9629, 'value': 500, 
+             'unit': 'companies', 'metric': 'survey size', 'source': 'McKinsey', 'context': 'Survey of 500 companies...', 'confidence': 0.7},
+        ]
+    
+    # Convert to DataFrame
+    df = pd.DataFrame(geo_data)
+    
+    # Rendering the map is the slow part, so keep the HTML from an earlier
+    # run made with identical data and an unchanged create_map_figure
+    digest = hashlib.sha1(inspect.getsource(create_map_figure).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    map_hash = digest.hexdigest()
+    try:
+        rendered_hash = MAP_HASH_FILE.read_text()
+    except OSError:
+        rendered_hash = None
+    
     # Save the figure
-    fig.write_html('geographic_data_mockup.html')
-    print("\nMap saved to: geographic_data_mockup.html")
+    if rendered_hash != map_hash or not MAP_FILE.exists():
+        create_map_figure(df).write_html(MAP_FILE)
+        MAP_HASH_FILE.parent.mkdir(exist_ok=True)
+        MAP_HASH_FILE.write_text(map_hash)
+    print(f"\nMap saved to: {MAP_FILE}")
     
     # Create a summary report
     print("\n" + "="*60)
@@ -3,11 +3,14 @@ Economic Metrics Extraction Schema
 Based on Stanford AI Index structure with extensions for comprehensive economic analysis
 """
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime
 
+import numpy as np
+
 
 class MetricCategory(Enum):
     """Primary economic categories aligned with Stanford AI Index"""
@@ -131,7 +134,7 @@ class DataQuality(Enum):
     LOW = "low"           # Inferred or approximate
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EconomicMetric:
     """Core data model for extracted economic metrics"""
     # Identification
@@ -173,7 +176,7 @@ class EconomicMetric:
     extractor_version: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExtractionTarget:
     """Defines what to look for in PDFs"""
     category: MetricCategory
@@ -187,6 +190,26 @@ class ExtractionTarget:
     max_value: Optional[float] = None
     require_year: bool = True
     require_geography: bool = False
+    
+    # Matches any keyword that starts a word, in any case
+    keyword_pattern: re.Pattern = field(init=False, repr=False, compare=False)
+    # The same match for each keyword on its own, to count the ones present
+    keyword_patterns: Tuple[re.Pattern, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen, so derived fields are set past the dataclass __setattr__
+        object.__setattr__(self, 'keyword_pattern', re.compile(
+            r'\b(?:' + '|'.join(re.escape(keyword) for keyword in self.keywords) + ')',
+            re.IGNORECASE
+        ))
+        object.__setattr__(self, 'keyword_patterns', tuple(
+            re.compile(r'\b' + re.escape(keyword), re.IGNORECASE) for keyword in self.keywords
+        ))
+
+
+# Checks applied to every text segment by should_extract_metric
+_NUM_RE = re.compile(r'\d+(\.\d+)?')
+_CITATION_RE = re.compile(r'\(\d{4}\)')
 
 
 # Pre-defined extraction targets based on Stanford structure
@@ -229,47 +252,130 @@ EXTRACTION_TARGETS = [
 ]
 
 
+def _build_keyword_index(targets: List[ExtractionTarget]) -> tuple[re.Pattern, Dict[str, frozenset]]:
+    """Combine the keywords of all targets into one pattern.
+    
+    Returns the pattern and, for each lowercased keyword it can match, the
+    indices of the targets that match at the same position.
+    """
+    keyword_targets: Dict[str, set] = {}
+    for index, target in enumerate(targets):
+        for keyword in target.keywords:
+            keyword_targets.setdefault(keyword.lower(), set()).add(index)
+    
+    # Longest first, so the match at a position is the longest keyword there;
+    # every shorter keyword that starts it matches there too
+    keywords = sorted(keyword_targets, key=len, reverse=True)
+    match_targets = {
+        keyword: frozenset().union(*(
+            indices for prefix, indices in keyword_targets.items()
+            if keyword.startswith(prefix)
+        ))
+        for keyword in keywords
+    }
+    
+    # An empty lookahead lets finditer try every word start, so keywords
+    # inside a longer match ("investment" in "return on investment") are found
+    pattern = re.compile(
+        r'\b(?=(' + '|'.join(re.escape(keyword) for keyword in keywords) + '))',
+        re.IGNORECASE
+    )
+    return pattern, match_targets
+
+
+_ALL_KEYWORDS_RE, _KEYWORD_MATCH_TARGETS = _build_keyword_index(EXTRACTION_TARGETS)
+
+
+# Units a labor market metric can't be measured in
+_FINANCIAL_UNITS = frozenset([Unit.USD_BILLIONS, Unit.USD_MILLIONS])
+
+# Integer codes for the unit and category columns of validate_metrics_batch
+UNIT_CODES = {unit: code for code, unit in enumerate(Unit)}
+CATEGORY_CODES = {category: code for code, category in enumerate(MetricCategory)}
+
+# The same codes by serialized value (e.g. "percentage"), to build those
+# columns from stored metrics without going through the enums
+UNIT_CODES_BY_VALUE = {unit.value: code for unit, code in UNIT_CODES.items()}
+CATEGORY_CODES_BY_VALUE = {category.value: code for category, code in CATEGORY_CODES.items()}
+
+# Codes the batch rules test for
+_PERCENTAGE_CODE = UNIT_CODES[Unit.PERCENTAGE]
+_USD_BILLIONS_CODE = UNIT_CODES[Unit.USD_BILLIONS]
+_USD_MILLIONS_CODE = UNIT_CODES[Unit.USD_MILLIONS]
+_LABOR_MARKET_CODE = CATEGORY_CODES[MetricCategory.LABOR_MARKET]
+
+
 def validate_metric(metric: EconomicMetric) -> tuple[bool, str]:
     """Validate an extracted metric against business rules"""
+    year, value, unit = metric.year, metric.value, metric.unit
+    
     # Check year makes sense
-    if metric.year and (metric.year < 2010 or metric.year > 2030):
-        return False, f"Invalid year: {metric.year}"
+    if year and (year < 2010 or year > 2030):
+        return False, f"Invalid year: {year}"
     
-    # Check value ranges by metric type
-    if metric.unit == Unit.PERCENTAGE:
-        if metric.value < 0 or metric.value > 100:
-            return False, f"Invalid percentage: {metric.value}"
+    # Check value ranges by metric type (enum members are singletons,
+    # so they are compared by identity)
+    if unit is Unit.PERCENTAGE:
+        if value < 0 or value > 100:
+            return False, f"Invalid percentage: {value}"
     
     # Ensure financial metrics aren't tiny
-    if metric.unit in [Unit.USD_BILLIONS] and metric.value < 0.01:
-        return False, f"Suspiciously small billions value: {metric.value}"
+    if unit is Unit.USD_BILLIONS and value < 0.01:
+        return False, f"Suspiciously small billions value: {value}"
     
     # Check category/type alignment
-    if metric.category == MetricCategory.LABOR_MARKET:
-        if metric.unit in [Unit.USD_BILLIONS, Unit.USD_MILLIONS]:
+    if metric.category is MetricCategory.LABOR_MARKET:
+        if unit in _FINANCIAL_UNITS:
             return False, "Labor market metric with financial unit"
     
     return True, "Valid"
 
 
-def should_extract_metric(text: str, target: ExtractionTarget) -> bool:
-    """Determine if text segment contains target metric"""
-    text_lower = text.lower()
+def validate_metrics_batch(year: np.ndarray, value: np.ndarray,
+                           unit: np.ndarray, category: np.ndarray) -> np.ndarray:
+    """
+    Apply the validate_metric rules to columns of many metrics at once.
     
-    # Check for any keywords
-    if not any(keyword in text_lower for keyword in target.keywords):
-        return False
+    Args:
+        year: Years, with 0 where a metric has none
+        value: Metric values
+        unit: UNIT_CODES of the metrics' units
+        category: CATEGORY_CODES of the metrics' categories
     
-    # Check for numeric values
-    import re
-    if not re.search(r'\d+(\.\d+)?', text):
-        return False
+    Returns:
+        Boolean array, True where validate_metric would accept the metric
+    """
+    year = np.asarray(year)
+    value = np.asarray(value, dtype=np.float64)
+    unit = np.asarray(unit)
+    category = np.asarray(category)
     
-    # Avoid citation years
-    if re.search(r'\(\d{4}\)', text):
+    bad_year = (year != 0) & ((year < 2010) | (year > 2030))
+    bad_percentage = (unit == _PERCENTAGE_CODE) & ((value < 0) | (value > 100))
+    is_billions = unit == _USD_BILLIONS_CODE
+    bad_billions = is_billions & (value < 0.01)
+    is_financial = is_billions | (unit == _USD_MILLIONS_CODE)
+    bad_labor = (category == _LABOR_MARKET_CODE) & is_financial
+    
+    return ~(bad_year | bad_percentage | bad_billions | bad_labor)
+
+
+def matching_targets(text: str) -> set[int]:
+    """Indices into EXTRACTION_TARGETS of the targets with a keyword in text"""
+    matched = set()
+    for match in _ALL_KEYWORDS_RE.finditer(text):
+        matched |= _KEYWORD_MATCH_TARGETS[match.group(1).lower()]
+    return matched
+
+
+def should_extract_metric(text: str, target: ExtractionTarget) -> bool:
+    """Determine if text segment contains target metric"""
+    # Check for any keywords
+    if not target.keyword_pattern.search(text):
         return False
     
-    return True
+    # Check for numeric values, avoiding citation years
+    return _NUM_RE.search(text) is not None and _CITATION_RE.search(text) is None
 
 
 # Example usage pattern
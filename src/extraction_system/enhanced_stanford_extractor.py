@@ -19,7 +19,7 @@ from collections import defaultdict
 from economic_metrics_schema import (
     EconomicMetric, MetricCategory, MetricType, Unit,
     GeographicScope, Sector, CompanySize, DataQuality,
-    EXTRACTION_TARGETS, validate_metric
+    EXTRACTION_TARGETS, matching_targets, validate_metric
 )
 
 
@@ -75,7 +75,9 @@ class EnhancedStanfordExtractor:
                 metrics.extend(structured_metrics)
                 
                 # Then, extract other metrics with deduplication
-                for target in EXTRACTION_TARGETS:
+                # (only the targets with a keyword somewhere on the page)
+                for index in sorted(matching_targets(text)):
+                    target = EXTRACTION_TARGETS[index]
                     page_metrics = self._extract_metrics_from_text(
                         text, target, pdf_path.name, page_num
                     )
@@ -282,7 +284,7 @@ class EnhancedStanfordExtractor:
         
         for chunk in chunks:
             # Skip if chunk doesn't contain relevant keywords
-            if not any(kw in chunk.lower() for kw in target.keywords):
+            if not target.keyword_pattern.search(chunk):
                 continue
                 
             # Enhanced numeric extraction
@@ -0,0 +1,87 @@
+"""
+Incremental reading of the JSON arrays written by the extraction pipeline.
+
+Candidate and validation files are a single top-level list. Decoding them
+item by item keeps only one item (plus a read buffer) in memory and lets
+callers stop early without parsing the rest of the file.
+"""
+
+import json
+import re
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+# Whitespace before an item or after the array
+_SPACE = re.compile(r'[ \t\n\r]*')
+# Whitespace and the comma or bracket that ends an item
+_ITEM_END = re.compile(r'[ \t\n\r]*([,\]])')
+
+
+def iter_json_array(f, chunk_size=65536):
+    """
+    Yield the items of the top-level JSON array in file f, one at a time.
+    
+    Accepts exactly what json.load accepts for an array: items separated by
+    single commas, and nothing but whitespace after the closing bracket.
+    Raises ValueError on anything else, once the reader gets that far.
+    """
+    buffer = f.read(chunk_size)
+    while buffer.isspace():
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        buffer = buffer.lstrip(_WHITESPACE) + chunk
+    buffer = buffer.lstrip(_WHITESPACE)
+    if not buffer.startswith('['):
+        raise ValueError("Expected a JSON array")
+    pos = 1
+    eof = False
+    first = True
+    
+    # Bound once, as they run for every item
+    skip_space = _SPACE.match
+    match_item_end = _ITEM_END.match
+    raw_decode = _decoder.raw_decode
+    
+    while True:
+        pos = skip_space(buffer, pos).end()
+        if pos < len(buffer):
+            char = buffer[pos]
+            if char == ']' and first:
+                pos += 1
+                break
+            if char in ',]':
+                # A leading, doubled or trailing comma
+                raise ValueError("Expected a JSON value")
+            try:
+                item, end = raw_decode(buffer, pos)
+                item_end = match_item_end(buffer, end)
+            except json.JSONDecodeError:
+                item_end = None
+            
+            if item_end:
+                yield item
+                first = False
+                pos = item_end.end()
+                if item_end.group(1) == ']':
+                    break
+                continue
+        
+        # The buffer ran out before the next item, or before the separator
+        # after it: a failed decode, or a number cut short at "1.5" of
+        # "1.5e10", may just mean the item continues in the next chunk
+        if eof:
+            raise ValueError("Invalid or unterminated JSON array")
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buffer, pos = buffer[pos:] + chunk, 0
+    
+    # Only whitespace may follow the array, up to the end of the file
+    rest = buffer[pos:]
+    while True:
+        if skip_space(rest).end() < len(rest):
+            raise ValueError("Extra data after the JSON array")
+        if eof:
+            return
+        rest = f.read(chunk_size)
+        eof = not rest
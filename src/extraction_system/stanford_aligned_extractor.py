@@ -14,7 +14,7 @@ import logging
 from economic_metrics_schema import (
     EconomicMetric, MetricCategory, MetricType, Unit,
     GeographicScope, Sector, CompanySize, DataQuality,
-    EXTRACTION_TARGETS, validate_metric
+    EXTRACTION_TARGETS, matching_targets, validate_metric
 )
 
 
@@ -55,7 +55,9 @@ class StanfordAlignedExtractor:
                 text = page.get_text()
                 
                 # Extract metrics by category
-                for target in EXTRACTION_TARGETS:
+                # (only the targets with a keyword somewhere on the page)
+                for index in sorted(matching_targets(text)):
+                    target = EXTRACTION_TARGETS[index]
                     page_metrics = self._extract_metrics_from_text(
                         text, target, pdf_path.name, page_num
                     )
@@ -88,7 +90,7 @@ class StanfordAlignedExtractor:
         
         for sentence in sentences:
             # Quick check if sentence might contain target metric
-            if not any(kw in sentence.lower() for kw in target.keywords):
+            if not target.keyword_pattern.search(sentence):
                 continue
                 
             # Extract numeric values with context
@@ -311,7 +313,7 @@ class StanfordAlignedExtractor:
         score = 0.5  # Base score
         
         # Boost for keyword matches
-        keyword_matches = sum(1 for kw in target.keywords if kw in text.lower())
+        keyword_matches = sum(1 for pattern in target.keyword_patterns if pattern.search(text))
         score += keyword_matches * 0.1
         
         # Boost for clear numeric statement